@@ -0,0 +1,152 @@
+"""Add worklog amounts aggregate table
+
+Revision ID: 3f8b2c91d4e7
+Revises: 9dfb02898407
+Create Date: 2026-08-27 10:15:42.118734
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3f8b2c91d4e7'
+down_revision = '9dfb02898407'
+branch_labels = None
+depends_on = None
+
+
+# Pre-aggregated per-worklog amounts, maintained incrementally: triggers on
+# the source tables recompute only the worklogs a statement touched, so write
+# cost scales with the statement instead of full history and reads are never
+# blocked behind a view refresh.
+TABLE_SQL = """
+CREATE TABLE worklog_amounts (
+    worklog_id uuid PRIMARY KEY REFERENCES worklog (id) ON DELETE CASCADE,
+    remitted numeric(12, 2) NOT NULL,
+    unremitted numeric(12, 2) NOT NULL,
+    total numeric(12, 2) NOT NULL,
+    remittance_status varchar NOT NULL
+)
+"""
+
+# Re-aggregates the given worklogs. The SQL mirrors
+# WorkLogService._calculate_worklog_amounts: per-segment amounts are rounded
+# to two decimal places before summing, only ACTIVE segments count, and a
+# worklog is UNREMITTED when it has outstanding amounts or no amounts at all.
+RECOMPUTE_FUNCTION_SQL = """
+CREATE FUNCTION worklog_amounts_recompute(target_ids uuid[]) RETURNS void AS $$
+INSERT INTO worklog_amounts (
+    worklog_id, remitted, unremitted, total, remittance_status
+)
+SELECT
+    wl.id,
+    COALESCE(seg.remitted, 0) + COALESCE(adj.remitted, 0),
+    COALESCE(seg.unremitted, 0) + COALESCE(adj.unremitted, 0),
+    COALESCE(seg.remitted, 0) + COALESCE(adj.remitted, 0)
+        + COALESCE(seg.unremitted, 0) + COALESCE(adj.unremitted, 0),
+    CASE
+        WHEN COALESCE(seg.unremitted, 0) + COALESCE(adj.unremitted, 0) > 0
+            OR COALESCE(seg.remitted, 0) + COALESCE(adj.remitted, 0)
+                + COALESCE(seg.unremitted, 0) + COALESCE(adj.unremitted, 0) = 0
+        THEN 'UNREMITTED'
+        ELSE 'REMITTED'
+    END
+FROM worklog wl
+LEFT JOIN (
+    SELECT
+        ts.worklog_id,
+        SUM(ROUND(EXTRACT(EPOCH FROM ts.end_time - ts.start_time)
+            / 3600 * w.hourly_rate, 2))
+            FILTER (WHERE ts.settlement_status = 'REMITTED') AS remitted,
+        SUM(ROUND(EXTRACT(EPOCH FROM ts.end_time - ts.start_time)
+            / 3600 * w.hourly_rate, 2))
+            FILTER (WHERE ts.settlement_status = 'UNREMITTED') AS unremitted
+    FROM timesegment ts
+    JOIN worklog w ON w.id = ts.worklog_id
+    WHERE ts.status = 'ACTIVE' AND ts.worklog_id = ANY(target_ids)
+    GROUP BY ts.worklog_id
+) seg ON seg.worklog_id = wl.id
+LEFT JOIN (
+    SELECT
+        a.worklog_id,
+        SUM(a.amount)
+            FILTER (WHERE a.settlement_status = 'REMITTED') AS remitted,
+        SUM(a.amount)
+            FILTER (WHERE a.settlement_status = 'UNREMITTED') AS unremitted
+    FROM adjustment a
+    WHERE a.worklog_id = ANY(target_ids)
+    GROUP BY a.worklog_id
+) adj ON adj.worklog_id = wl.id
+WHERE wl.id = ANY(target_ids)
+ON CONFLICT (worklog_id) DO UPDATE SET
+    remitted = EXCLUDED.remitted,
+    unremitted = EXCLUDED.unremitted,
+    total = EXCLUDED.total,
+    remittance_status = EXCLUDED.remittance_status
+$$ LANGUAGE sql
+"""
+
+# Statement-level sync triggers: the transition table holds exactly the rows
+# the statement changed, so each statement pays for its own worklogs only.
+# Transition tables allow a single event per trigger, hence one per event.
+SYNC_SELF_FUNCTION_SQL = """
+CREATE FUNCTION worklog_amounts_sync_self() RETURNS trigger AS $$
+BEGIN
+    PERFORM worklog_amounts_recompute(
+        ARRAY(SELECT DISTINCT id FROM changed)
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+SYNC_CHILD_FUNCTION_SQL = """
+CREATE FUNCTION worklog_amounts_sync_child() RETURNS trigger AS $$
+BEGIN
+    PERFORM worklog_amounts_recompute(
+        ARRAY(SELECT DISTINCT worklog_id FROM changed)
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# (table, trigger function, events) — worklog DELETE is covered by the
+# ON DELETE CASCADE on worklog_amounts itself
+SYNC_TRIGGERS = (
+    ('worklog', 'worklog_amounts_sync_self', ('INSERT', 'UPDATE')),
+    ('timesegment', 'worklog_amounts_sync_child', ('INSERT', 'UPDATE', 'DELETE')),
+    ('adjustment', 'worklog_amounts_sync_child', ('INSERT', 'UPDATE', 'DELETE')),
+)
+
+
+def upgrade():
+    op.execute(TABLE_SQL)
+    op.execute(RECOMPUTE_FUNCTION_SQL)
+    op.execute(SYNC_SELF_FUNCTION_SQL)
+    op.execute(SYNC_CHILD_FUNCTION_SQL)
+    for table, function, events in SYNC_TRIGGERS:
+        for event in events:
+            transition = 'OLD' if event == 'DELETE' else 'NEW'
+            op.execute(
+                f'CREATE TRIGGER trg_worklog_amounts_{event.lower()} '
+                f'AFTER {event} ON {table} '
+                f'REFERENCING {transition} TABLE AS changed '
+                f'FOR EACH STATEMENT EXECUTE FUNCTION {function}()'
+            )
+    # Backfill existing worklogs through the same aggregation
+    op.execute(
+        'SELECT worklog_amounts_recompute(ARRAY(SELECT id FROM worklog))'
+    )
+
+
+def downgrade():
+    for table, _function, events in SYNC_TRIGGERS:
+        for event in events:
+            op.execute(
+                f'DROP TRIGGER trg_worklog_amounts_{event.lower()} ON {table}'
+            )
+    op.execute('DROP FUNCTION worklog_amounts_sync_self()')
+    op.execute('DROP FUNCTION worklog_amounts_sync_child()')
+    op.execute('DROP FUNCTION worklog_amounts_recompute(uuid[])')
+    op.execute('DROP TABLE worklog_amounts')
@@ -0,0 +1,42 @@
+"""Add settlement query indexes
+
+Revision ID: 7c4e9a15f2b3
+Revises: 3f8b2c91d4e7
+Create Date: 2026-08-27 11:02:17.664021
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7c4e9a15f2b3'
+down_revision = '3f8b2c91d4e7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_timesegment_settlement_period',
+        'timesegment',
+        ['settlement_status', 'status', 'end_time'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_adjustment_settlement_period',
+        'adjustment',
+        ['settlement_status', 'created_at'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_worklog_worker_created',
+        'worklog',
+        ['worker_id', 'created_at'],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_worklog_worker_created', table_name='worklog')
+    op.drop_index('ix_adjustment_settlement_period', table_name='adjustment')
+    op.drop_index('ix_timesegment_settlement_period', table_name='timesegment')
@@ -0,0 +1,30 @@
+"""Add worker settlement locks
+
+Revision ID: a1c5e7f92b38
+Revises: f7b2d9c84e56
+Create Date: 2026-08-27 16:05:12.664318
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1c5e7f92b38'
+down_revision = 'f7b2d9c84e56'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'workersettlementlock',
+        sa.Column('worker_id', sa.Uuid(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['worker_id'], ['user.id']),
+        sa.PrimaryKeyConstraint('worker_id'),
+    )
+
+
+def downgrade():
+    op.drop_table('workersettlementlock')
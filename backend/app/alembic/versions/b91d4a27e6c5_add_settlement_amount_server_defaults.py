@@ -0,0 +1,32 @@
+"""Add settlement amount server defaults
+
+Revision ID: b91d4a27e6c5
+Revises: 7c4e9a15f2b3
+Create Date: 2026-08-27 13:41:52.118436
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b91d4a27e6c5'
+down_revision = '7c4e9a15f2b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column('remittance', 'gross_amount', server_default=sa.text('0'))
+    op.alter_column('remittance', 'net_amount', server_default=sa.text('0'))
+    op.alter_column('worklog', 'hourly_rate', server_default=sa.text('0'))
+    op.alter_column(
+        'worklog', 'total_remitted_amount', server_default=sa.text('0')
+    )
+
+
+def downgrade():
+    op.alter_column('worklog', 'total_remitted_amount', server_default=None)
+    op.alter_column('worklog', 'hourly_rate', server_default=None)
+    op.alter_column('remittance', 'net_amount', server_default=None)
+    op.alter_column('remittance', 'gross_amount', server_default=None)
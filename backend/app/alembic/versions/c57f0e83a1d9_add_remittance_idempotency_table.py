@@ -0,0 +1,35 @@
+"""Add remittance idempotency table
+
+Revision ID: c57f0e83a1d9
+Revises: b91d4a27e6c5
+Create Date: 2026-08-27 14:27:39.502918
+
+"""
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c57f0e83a1d9'
+down_revision = 'b91d4a27e6c5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'remittanceidempotency',
+        sa.Column(
+            'key',
+            sqlmodel.sql.sqltypes.AutoString(length=255),
+            nullable=False,
+        ),
+        sa.Column('payload', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+    )
+
+
+def downgrade():
+    op.drop_table('remittanceidempotency')
@@ -0,0 +1,35 @@
+"""Add idempotency request fingerprint
+
+Revision ID: d4e6b29c8f17
+Revises: a1c5e7f92b38
+Create Date: 2026-08-27 18:42:11.370254
+
+"""
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4e6b29c8f17'
+down_revision = 'a1c5e7f92b38'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows predate fingerprinting; an empty digest never matches
+    # a real one, so stale keys conflict instead of replaying
+    op.add_column(
+        'remittanceidempotency',
+        sa.Column(
+            'request_fingerprint',
+            sqlmodel.sql.sqltypes.AutoString(length=64),
+            nullable=False,
+            server_default='',
+        ),
+    )
+
+
+def downgrade():
+    op.drop_column('remittanceidempotency', 'request_fingerprint')
@@ -0,0 +1,40 @@
+"""Add unremitted partial indexes
+
+Revision ID: e4a8c6b93f21
+Revises: c57f0e83a1d9
+Create Date: 2026-08-27 15:03:26.871554
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4a8c6b93f21'
+down_revision = 'c57f0e83a1d9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_timesegment_unremitted',
+        'timesegment',
+        ['end_time'],
+        unique=False,
+        postgresql_where=sa.text(
+            "settlement_status = 'UNREMITTED' AND status = 'ACTIVE'"
+        ),
+    )
+    op.create_index(
+        'ix_adjustment_unremitted',
+        'adjustment',
+        ['created_at'],
+        unique=False,
+        postgresql_where=sa.text("settlement_status = 'UNREMITTED'"),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_adjustment_unremitted', table_name='adjustment')
+    op.drop_index('ix_timesegment_unremitted', table_name='timesegment')
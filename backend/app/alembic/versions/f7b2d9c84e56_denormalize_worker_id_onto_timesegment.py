@@ -0,0 +1,80 @@
+"""Denormalize worker_id onto timesegment
+
+Revision ID: f7b2d9c84e56
+Revises: e4a8c6b93f21
+Create Date: 2026-08-27 15:21:44.932710
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7b2d9c84e56'
+down_revision = 'e4a8c6b93f21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('timesegment', sa.Column('worker_id', sa.Uuid(), nullable=True))
+    op.create_foreign_key(
+        'timesegment_worker_id_fkey', 'timesegment', 'user',
+        ['worker_id'], ['id'],
+    )
+    op.execute(
+        """
+        UPDATE timesegment ts
+        SET worker_id = wl.worker_id
+        FROM worklog wl
+        WHERE ts.worklog_id = wl.id
+        """
+    )
+    # Keep the copy in sync for rows inserted without it; worklogs never
+    # change owner, so insert time is the only sync point needed
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION timesegment_fill_worker_id()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            IF NEW.worker_id IS NULL THEN
+                SELECT worker_id INTO NEW.worker_id
+                FROM worklog
+                WHERE id = NEW.worklog_id;
+            END IF;
+            RETURN NEW;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_timesegment_fill_worker_id
+        BEFORE INSERT ON timesegment
+        FOR EACH ROW
+        EXECUTE FUNCTION timesegment_fill_worker_id()
+        """
+    )
+    op.create_index(
+        'ix_timesegment_worker_unremitted',
+        'timesegment',
+        ['worker_id', 'end_time'],
+        unique=False,
+        postgresql_where=sa.text(
+            "settlement_status = 'UNREMITTED' AND status = 'ACTIVE'"
+        ),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_timesegment_worker_unremitted', table_name='timesegment')
+    op.execute(
+        'DROP TRIGGER IF EXISTS trg_timesegment_fill_worker_id ON timesegment'
+    )
+    op.execute('DROP FUNCTION IF EXISTS timesegment_fill_worker_id()')
+    op.drop_constraint(
+        'timesegment_worker_id_fkey', 'timesegment', type_='foreignkey'
+    )
+    op.drop_column('timesegment', 'worker_id')
@@ -0,0 +1,85 @@
+"""
+WorkLog Settlement System - Background Jobs
+
+In-process registry for settlement runs executed outside the request
+cycle. Jobs run on FastAPI background tasks against their own session,
+so the HTTP worker is freed as soon as the 202 is sent; state lives in
+process memory, which matches the single-instance deployment this
+template targets. An external queue can replace the registry later
+without changing the API surface.
+"""
+import threading
+import uuid
+from collections import OrderedDict
+
+from fastapi import HTTPException
+from sqlmodel import Session
+
+from app.api.routes.worklog.schemas import (
+    GenerateRemittancesRequest,
+    RemittanceJobPublic,
+    RemittanceJobStatus,
+)
+from app.api.routes.worklog.service import WorkLogService
+from app.core.db import engine
+
+# Most recent job states, keyed by task id; bounded so long-lived
+# processes don't accumulate finished jobs forever
+_MAX_TRACKED_JOBS = 256
+
+_jobs: OrderedDict[str, RemittanceJobPublic] = OrderedDict()
+_jobs_lock = threading.Lock()
+
+
+def create_job() -> str:
+    """Register a new pending settlement job and return its task id."""
+    task_id = str(uuid.uuid4())
+    with _jobs_lock:
+        _jobs[task_id] = RemittanceJobPublic(
+            task_id=task_id, status=RemittanceJobStatus.PENDING
+        )
+        while len(_jobs) > _MAX_TRACKED_JOBS:
+            _jobs.popitem(last=False)
+    return task_id
+
+
+def get_job(task_id: str) -> RemittanceJobPublic:
+    """Look up a job by task id, raising 404 for unknown (or evicted) ids."""
+    with _jobs_lock:
+        job = _jobs.get(task_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown task id")
+    return job
+
+
+def _update(task_id: str, **changes: object) -> None:
+    with _jobs_lock:
+        job = _jobs.get(task_id)
+        if job is not None:
+            _jobs[task_id] = job.model_copy(update=changes)
+
+
+def run_generate_remittances(
+    task_id: str,
+    request: GenerateRemittancesRequest,
+    idempotency_key: str | None = None,
+) -> None:
+    """Execute one settlement run and record its outcome in the registry."""
+    _update(task_id, status=RemittanceJobStatus.RUNNING)
+    try:
+        with Session(engine) as session:
+            response = WorkLogService.generate_remittances(
+                session=session,
+                request=request,
+                idempotency_key=idempotency_key,
+            )
+    except HTTPException as exc:
+        _update(task_id, status=RemittanceJobStatus.FAILED, error=str(exc.detail))
+    except Exception as exc:
+        _update(task_id, status=RemittanceJobStatus.FAILED, error=str(exc))
+    else:
+        _update(
+            task_id,
+            status=RemittanceJobStatus.COMPLETED,
+            result=response.model_dump(mode="json"),
+        )
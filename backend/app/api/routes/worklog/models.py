@@ -11,13 +11,20 @@ import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
+from functools import partial
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
     from app.models import User
 
+# Shared default factory: avoids building a new lambda frame per row and is
+# reused across all timestamp columns; batch inserts pass an explicit value
+# so one timestamp covers the whole batch
+_utcnow = partial(datetime.now, timezone.utc)
+
 
 # =============================================================================
 # Enums
@@ -63,7 +70,7 @@ class Task(SQLModel, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     title: str = Field(max_length=255)
     description: Optional[str] = Field(default=None, max_length=1024)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
 
     worklogs: list["WorkLog"] = Relationship(back_populates="task")
 
@@ -78,9 +85,16 @@ class Remittance(SQLModel, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     worker_id: uuid.UUID = Field(foreign_key="user.id", nullable=False, index=True)
     
-    # Amount tracking
-    gross_amount: Decimal = Field(default=Decimal("0"), max_digits=12, decimal_places=2)
-    net_amount: Decimal = Field(default=Decimal("0"), max_digits=12, decimal_places=2)
+    # Amount tracking; defaults live in the database so the batched
+    # insert path never builds per-row Decimal zeros in Python
+    gross_amount: Decimal = Field(
+        max_digits=12, decimal_places=2,
+        sa_column_kwargs={"server_default": text("0")},
+    )
+    net_amount: Decimal = Field(
+        max_digits=12, decimal_places=2,
+        sa_column_kwargs={"server_default": text("0")},
+    )
     
     # Status and lifecycle
     status: RemittanceStatus = Field(default=RemittanceStatus.PENDING)
@@ -91,13 +105,46 @@ class Remittance(SQLModel, table=True):
     period_end: Optional[datetime] = Field(default=None)
     
     # Timestamps
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
     processed_at: Optional[datetime] = Field(default=None)
     
     # Relationships
     worklogs: list["WorkLog"] = Relationship(back_populates="remittance")
 
 
+class RemittanceIdempotency(SQLModel, table=True):
+    """
+    Replay cache for settlement runs keyed by Idempotency-Key.
+
+    A retried POST with the same key returns the stored response instead
+    of re-running settlement; the primary key doubles as the uniqueness
+    guard so concurrent duplicates fail fast. The fingerprint records
+    which request the key was first used for, so a reused key with
+    different parameters is rejected rather than replayed.
+    """
+    key: str = Field(primary_key=True, max_length=255)
+    request_fingerprint: str = Field(
+        max_length=64,
+        description="Digest of the resolved settlement parameters",
+    )
+    payload: str = Field(description="Serialized response body for replay")
+    created_at: datetime = Field(default_factory=_utcnow)
+
+
+class WorkerSettlementLock(SQLModel, table=True):
+    """
+    Per-worker advisory row for settlement runs.
+
+    Settlement takes these rows FOR UPDATE SKIP LOCKED, so concurrent
+    runs over disjoint workers proceed in parallel while a contended
+    worker stays with whichever run locked it first. Rows are created on
+    demand and never deleted; the row lock itself is the mutex and
+    releases with the batch commit.
+    """
+    worker_id: uuid.UUID = Field(foreign_key="user.id", primary_key=True)
+    created_at: datetime = Field(default_factory=_utcnow)
+
+
 class WorkLog(SQLModel, table=True):
     """
     Container for work done by a worker on a task.
@@ -105,20 +152,28 @@ class WorkLog(SQLModel, table=True):
     Links to multiple time segments and adjustments.
     Tracks total remitted amount for delta calculations.
     """
+    __table_args__ = (
+        Index("ix_worklog_worker_created", "worker_id", "created_at"),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     task_id: uuid.UUID = Field(foreign_key="task.id", nullable=False, index=True)
     worker_id: uuid.UUID = Field(foreign_key="user.id", nullable=False, index=True)
-    hourly_rate: Decimal = Field(default=Decimal("0"), max_digits=10, decimal_places=2)
+    hourly_rate: Decimal = Field(
+        default=Decimal("0"), max_digits=10, decimal_places=2,
+        sa_column_kwargs={"server_default": text("0")},
+    )
     
     # Delta tracking: how much has already been paid for this worklog
     total_remitted_amount: Decimal = Field(
         default=Decimal("0"), max_digits=12, decimal_places=2,
+        sa_column_kwargs={"server_default": text("0")},
         description="Running total of amounts already settled"
     )
     
     # Link to current/last remittance (nullable until settled)
     remittance_id: Optional[uuid.UUID] = Field(default=None, foreign_key="remittance.id")
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
 
     # Relationships
     task: Task = Relationship(back_populates="worklogs")
@@ -131,6 +186,24 @@ class WorkLog(SQLModel, table=True):
     )
 
 
+class WorkLogAmounts(SQLModel, table=True):
+    """
+    Read-only mapping of the worklog_amounts aggregate table.
+
+    Pre-aggregates per-worklog remitted/unremitted/total amounts and the
+    derived remittance status. Maintained incrementally by statement-level
+    triggers on worklog, timesegment, and adjustment that recompute only
+    the worklogs each statement touched (see Alembic migration).
+    """
+    __tablename__ = "worklog_amounts"
+
+    worklog_id: uuid.UUID = Field(primary_key=True)
+    remitted: Decimal
+    unremitted: Decimal
+    total: Decimal
+    remittance_status: str
+
+
 class TimeSegment(SQLModel, table=True):
     """
     Individual time entry within a worklog.
@@ -138,8 +211,41 @@ class TimeSegment(SQLModel, table=True):
     Tracks settlement status separately to support retroactive work
     being added after initial settlement.
     """
+    __table_args__ = (
+        Index(
+            "ix_timesegment_settlement_period",
+            "settlement_status",
+            "status",
+            "end_time",
+        ),
+        # Partial index covering exactly the settlement fetch: unremitted
+        # ACTIVE segments by end_time. Stays tiny once most history is
+        # settled
+        Index(
+            "ix_timesegment_unremitted",
+            "end_time",
+            postgresql_where=text(
+                "settlement_status = 'UNREMITTED' AND status = 'ACTIVE'"
+            ),
+        ),
+        # Settlement groups unremitted segments per worker; the partial
+        # composite serves that scan without touching worklog
+        Index(
+            "ix_timesegment_worker_unremitted",
+            "worker_id",
+            "end_time",
+            postgresql_where=text(
+                "settlement_status = 'UNREMITTED' AND status = 'ACTIVE'"
+            ),
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     worklog_id: uuid.UUID = Field(foreign_key="worklog.id", nullable=False, index=True)
+
+    # Denormalized from the parent worklog so per-worker scans skip the
+    # join; a BEFORE INSERT trigger fills it when the app leaves it unset
+    worker_id: Optional[uuid.UUID] = Field(default=None, foreign_key="user.id")
     
     # Time tracking
     start_time: datetime
@@ -152,7 +258,7 @@ class TimeSegment(SQLModel, table=True):
     # Optional: link to the remittance that settled this segment
     remittance_id: Optional[uuid.UUID] = Field(default=None, foreign_key="remittance.id")
     
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
 
     worklog: WorkLog = Relationship(back_populates="time_segments")
 
@@ -164,6 +270,21 @@ class Adjustment(SQLModel, table=True):
     Supports retroactive adjustments by tracking settlement status
     independently of the parent worklog.
     """
+    __table_args__ = (
+        Index(
+            "ix_adjustment_settlement_period",
+            "settlement_status",
+            "created_at",
+        ),
+        # Partial twin of ix_timesegment_unremitted for the adjustment
+        # fetch
+        Index(
+            "ix_adjustment_unremitted",
+            "created_at",
+            postgresql_where=text("settlement_status = 'UNREMITTED'"),
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     worklog_id: uuid.UUID = Field(foreign_key="worklog.id", nullable=False, index=True)
     
@@ -176,6 +297,6 @@ class Adjustment(SQLModel, table=True):
     settlement_status: SettlementStatus = Field(default=SettlementStatus.UNREMITTED)
     remittance_id: Optional[uuid.UUID] = Field(default=None, foreign_key="remittance.id")
     
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
 
     worklog: WorkLog = Relationship(back_populates="adjustments")
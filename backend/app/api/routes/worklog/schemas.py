@@ -7,6 +7,7 @@ Designed for comprehensive validation and documentation.
 import uuid
 from datetime import date, datetime
 from decimal import Decimal
+from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field, computed_field
@@ -19,6 +20,17 @@ from app.api.routes.worklog.models import (
 )
 
 
+# =============================================================================
+# Query Parameter Enums
+# =============================================================================
+
+
+class RemittanceFilter(str, Enum):
+    """Valid values for the remittanceStatus list filter."""
+    REMITTED = "REMITTED"
+    UNREMITTED = "UNREMITTED"
+
+
 # =============================================================================
 # Nested Models for WorkLog
 # =============================================================================
@@ -95,6 +107,20 @@ class WorkLogsPublic(BaseModel):
     """Paginated list of worklogs."""
     data: list[WorkLogPublic]
     count: int
+    next_cursor: str | None = Field(
+        default=None,
+        description="Keyset cursor for the next page; null on the last page",
+    )
+
+
+class WorkLogSummary(BaseModel):
+    """Aggregate settlement totals across all worklogs."""
+    total: int = Field(description="Total number of worklogs")
+    remitted_count: int = Field(description="Worklogs with nothing left to pay")
+    unremitted_count: int = Field(description="Worklogs with unpaid amounts")
+    total_unremitted_amount: Decimal = Field(
+        description="Sum of all unpaid amounts across worklogs"
+    )
 
 
 # =============================================================================
@@ -157,6 +183,27 @@ class GenerateRemittancesRequest(BaseModel):
     }
 
 
+class RemittanceJobStatus(str, Enum):
+    """Lifecycle of a queued settlement run."""
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class RemittanceJobPublic(BaseModel):
+    """Status of a queued settlement run, for polling clients."""
+    task_id: str
+    status: RemittanceJobStatus
+    result: dict[str, Any] | None = Field(
+        default=None,
+        description="GenerateRemittancesResponse payload once completed",
+    )
+    error: str | None = Field(
+        default=None, description="Failure detail when status is FAILED"
+    )
+
+
 # =============================================================================
 # Response Models
 # =============================================================================
@@ -4,34 +4,110 @@ WorkLog Settlement System - Service Layer
 Business logic for worklog listing and remittance generation.
 Designed for correctness, auditability, and handling edge cases.
 """
+import base64
+import hashlib
 import uuid
 from collections import defaultdict
+from collections.abc import Iterator
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from itertools import groupby
 from typing import Any
 
 from fastapi import HTTPException
-from sqlmodel import Session, select
+from sqlalchemy import Numeric, Uuid, column, func, tuple_, update, values
+from sqlalchemy import select as sa_select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import Select
 
 from app.api.routes.worklog.models import (
     Adjustment,
     Remittance,
+    RemittanceIdempotency,
     RemittanceStatus,
     SettlementStatus,
     TimeSegment,
     TimeSegmentStatus,
+    WorkerSettlementLock,
     WorkLog,
+    WorkLogAmounts,
 )
 from app.api.routes.worklog.schemas import (
     GenerateRemittancesRequest,
     GenerateRemittancesResponse,
+    RemittanceFilter,
     RemittancePublic,
     WorkLogAmount,
     WorkLogPublic,
     WorkLogsPublic,
+    WorkLogSummary,
 )
 
 
+# Decimal constants shared by the hot calculation paths; Decimal("...")
+# parses its argument on every call, so build these once at import time
+_ZERO = Decimal("0")
+_TWO_PLACES = Decimal("0.01")
+_MICROSECONDS_PER_HOUR = Decimal(3_600_000_000)
+
+# Workers settled per transaction in generate_remittances; each batch
+# commits on its own so locks and memory stay bounded
+_SETTLEMENT_BATCH_SIZE = 500
+
+# Rows per server-side cursor fetch when streaming the list; selectinload
+# batches the nested segments/adjustments per partition, so memory holds
+# at most this many worklogs plus their payloads at once
+_STREAM_BATCH_SIZE = 200
+
+# Column order for the COPY-based remittance insert
+_REMITTANCE_COPY_COLUMNS = (
+    "id",
+    "worker_id",
+    "gross_amount",
+    "net_amount",
+    "status",
+    "failure_reason",
+    "period_start",
+    "period_end",
+    "created_at",
+    "processed_at",
+)
+
+
+@lru_cache(maxsize=4)
+def _default_period_for(day_ordinal: int) -> tuple[date, date]:
+    """Default settlement period (current calendar month) for a given day."""
+    today = date.fromordinal(day_ordinal)
+    period_start = today.replace(day=1)
+    next_month = (period_start + timedelta(days=32)).replace(day=1)
+    return period_start, next_month - timedelta(days=1)
+
+
+class _WorkLogWithAmounts:
+    """
+    Attribute view pairing a WorkLog row with its computed fields.
+
+    Lets WorkLogPublic.model_validate read everything via from_attributes
+    without building intermediate dicts per worklog.
+    """
+
+    __slots__ = ("_worklog", "amounts", "remittance_status")
+
+    def __init__(
+        self, worklog: WorkLog, amounts: WorkLogAmount, remittance_status: str
+    ) -> None:
+        self._worklog = worklog
+        self.amounts = amounts
+        self.remittance_status = remittance_status
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._worklog, name)
+
+
 class WorkLogService:
     """
     Service class for WorkLog settlement operations.
@@ -54,17 +130,26 @@ class WorkLogService:
     ) -> Decimal:
         """Calculate amount for a single time segment."""
         if segment.status != TimeSegmentStatus.ACTIVE:
-            return Decimal("0")
+            return _ZERO
         
+        # timedelta stores days/seconds/microseconds as ints, so stay in
+        # integer space instead of the float -> str -> Decimal round trip
         duration = segment.end_time - segment.start_time
-        if duration.total_seconds() < 0:
+        total_us = (
+            duration.days * 86_400_000_000
+            + duration.seconds * 1_000_000
+            + duration.microseconds
+        )
+        if total_us < 0:
             raise HTTPException(
                 status_code=400,
                 detail=f"Segment {segment.id} has negative duration"
             )
-        
-        hours = Decimal(str(duration.total_seconds())) / Decimal("3600")
-        amount = (hours * hourly_rate).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        if total_us == 0:
+            return _ZERO
+
+        hours = Decimal(total_us) / _MICROSECONDS_PER_HOUR
+        amount = (hours * hourly_rate).quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
         return amount
 
     @staticmethod
@@ -72,37 +157,60 @@ class WorkLogService:
         worklog: WorkLog,
     ) -> tuple[Decimal, Decimal, Decimal]:
         """
-        Calculate amounts for a worklog.
-        
+        Calculate amounts for a worklog in Python.
+
+        Reference implementation of the worklog_amounts aggregation used
+        by list_all_worklogs; kept for spot recomputation and cross-checks.
+
+        The remitted side is taken from total_remitted_amount, which the
+        settlement path keeps as a running total, so only the UNREMITTED
+        rows are summed here; settled history is never re-walked.
+
         Returns:
             Tuple of (remitted_amount, unremitted_amount, total_amount)
         """
-        remitted = Decimal("0")
-        unremitted = Decimal("0")
-        
-        # Calculate from time segments
+        remitted = worklog.total_remitted_amount
+
+        # Sum as integer cents (amounts are quantized to two places) and
+        # convert to Decimal once at the end
+        unremitted_cents = 0
+
         for segment in worklog.time_segments:
-            if segment.status != TimeSegmentStatus.ACTIVE:
+            if (
+                segment.status != TimeSegmentStatus.ACTIVE
+                or segment.settlement_status == SettlementStatus.REMITTED
+            ):
                 continue
-            
+
             amount = WorkLogService._calculate_segment_amount(
                 segment, worklog.hourly_rate
             )
-            
-            if segment.settlement_status == SettlementStatus.REMITTED:
-                remitted += amount
-            else:
-                unremitted += amount
-        
-        # Add adjustments
+            unremitted_cents += int(amount.scaleb(2))
+
         for adj in worklog.adjustments:
-            if adj.settlement_status == SettlementStatus.REMITTED:
-                remitted += adj.amount
-            else:
-                unremitted += adj.amount
-        
-        total = remitted + unremitted
-        return remitted, unremitted, total
+            if adj.settlement_status != SettlementStatus.REMITTED:
+                unremitted_cents += int(adj.amount.scaleb(2))
+
+        unremitted = Decimal(unremitted_cents).scaleb(-2)
+        return remitted, unremitted, remitted + unremitted
+
+    @staticmethod
+    def _encode_cursor(created_at: datetime, worklog_id: uuid.UUID) -> str:
+        """Encode a keyset pagination cursor for (created_at, id)."""
+        raw = f"{created_at.isoformat()}|{worklog_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+        """Decode a keyset cursor, raising 400 on malformed input."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            created_raw, _, id_raw = raw.partition("|")
+            return datetime.fromisoformat(created_raw), uuid.UUID(id_raw)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise HTTPException(
+                status_code=400, detail="Invalid cursor"
+            ) from exc
 
     @staticmethod
     def _resolve_period(
@@ -113,15 +221,15 @@ class WorkLogService:
         
         Defaults to current month if not specified.
         """
-        today = date.today()
-        
-        if period_start is None:
-            period_start = today.replace(day=1)
-        
-        if period_end is None:
-            # Default to end of current month
-            next_month = (today.replace(day=1) + timedelta(days=32)).replace(day=1)
-            period_end = next_month - timedelta(days=1)
+        if period_start is None or period_end is None:
+            # Month boundaries only change once a day; cache by ordinal
+            default_start, default_end = _default_period_for(
+                date.today().toordinal()
+            )
+            if period_start is None:
+                period_start = default_start
+            if period_end is None:
+                period_end = default_end
         
         if period_end < period_start:
             raise HTTPException(
@@ -131,97 +239,355 @@ class WorkLogService:
         
         return period_start, period_end
 
+    @staticmethod
+    def _request_fingerprint(
+        period_start: date,
+        period_end: date,
+        payout_status: RemittanceStatus | None,
+    ) -> str:
+        """Stable digest of the resolved settlement parameters."""
+        raw = f"{period_start}|{period_end}|{payout_status}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    @staticmethod
+    def _persist_remittances(
+        session: Session,
+        *,
+        remittance_rows: list[dict[str, Any]],
+        segment_links: dict[uuid.UUID, list[uuid.UUID]],
+        adjustment_links: dict[uuid.UUID, list[uuid.UUID]],
+        worklog_deltas: dict[uuid.UUID, Decimal],
+        worklog_remittance_ids: dict[uuid.UUID, uuid.UUID],
+    ) -> None:
+        """
+        Write a settlement run using batched statements.
+
+        Remittances are streamed to Postgres with COPY ... FROM STDIN
+        (IDs are pre-generated by the caller), then each affected table
+        gets exactly one UPDATE ... FROM (VALUES ...) statement: segment
+        and adjustment links across all remittances in one pass each, and
+        worklog running totals in a third.
+        """
+        # COPY writes all rows in a single round trip and skips per-row
+        # statement parsing entirely
+        copy_sql = "COPY remittance ({}) FROM STDIN".format(
+            ", ".join(_REMITTANCE_COPY_COLUMNS)
+        )
+        with session.connection().connection.cursor().copy(copy_sql) as copy:
+            for row in remittance_rows:
+                copy.write_row(tuple(row[c] for c in _REMITTANCE_COPY_COLUMNS))
+
+        WorkLogService._link_settled_rows(session, TimeSegment, segment_links)
+        WorkLogService._link_settled_rows(session, Adjustment, adjustment_links)
+
+        # One UPDATE ... FROM (VALUES ...) covers every worklog: rows with
+        # settled segments also repoint their last remittance, while
+        # adjustment-only rows carry NULL and keep their current link
+        total_rows = [
+            (wl_id, delta, worklog_remittance_ids.get(wl_id))
+            for wl_id, delta in worklog_deltas.items()
+        ]
+        if total_rows:
+            totals = values(
+                column("id", Uuid()),
+                column("delta", Numeric(12, 2)),
+                column("remittance_id", Uuid()),
+                name="settled_totals",
+            ).data(total_rows)
+            worklog_table = WorkLog.__table__  # type: ignore[attr-defined]
+            session.execute(
+                update(worklog_table)
+                .where(worklog_table.c.id == totals.c.id)
+                .values(
+                    total_remitted_amount=worklog_table.c.total_remitted_amount
+                    + totals.c.delta,
+                    remittance_id=func.coalesce(
+                        totals.c.remittance_id, worklog_table.c.remittance_id
+                    ),
+                )
+            )
+
+    @staticmethod
+    def _acquire_worker_locks(
+        session: Session, worker_ids: list[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        """
+        Take per-worker settlement locks, skipping contended workers.
+
+        Lock rows are created on demand, then selected FOR UPDATE
+        SKIP LOCKED: only workers no other run currently owns come back,
+        so concurrent settlement runs split disjoint workers between
+        them instead of one aborting the other. The locks release with
+        the batch commit.
+        """
+        session.execute(
+            pg_insert(WorkerSettlementLock)
+            .values([{"worker_id": worker_id} for worker_id in worker_ids])
+            .on_conflict_do_nothing()
+        )
+        owned = session.exec(
+            select(WorkerSettlementLock.worker_id)
+            .where(col(WorkerSettlementLock.worker_id).in_(worker_ids))
+            .with_for_update(skip_locked=True)
+        ).all()
+        return set(owned)
+
+    @staticmethod
+    def _link_settled_rows(
+        session: Session,
+        model: type[TimeSegment] | type[Adjustment],
+        links: dict[uuid.UUID, list[uuid.UUID]],
+    ) -> None:
+        """
+        Mark settled rows and point them at their remittance.
+
+        The (row_id, remittance_id) pairs are COPYed into a temp stage
+        table (ON COMMIT DROP) and applied with one UPDATE ... FROM, so
+        link volume never inflates statement size or parameter parsing —
+        the statement count stays constant regardless of how many rows
+        settled.
+        """
+        pairs = [
+            (row_id, remittance_id)
+            for remittance_id, ids in links.items()
+            for row_id in ids
+        ]
+        if not pairs:
+            return
+        cursor = session.connection().connection.cursor()
+        cursor.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS settlement_links "
+            "(row_id uuid, remittance_id uuid) ON COMMIT DROP"
+        )
+        with cursor.copy(
+            "COPY settlement_links (row_id, remittance_id) FROM STDIN"
+        ) as copy:
+            for pair in pairs:
+                copy.write_row(pair)
+        cursor.execute(
+            f"UPDATE {model.__tablename__} AS t "
+            "SET settlement_status = 'REMITTED', "
+            "remittance_id = s.remittance_id "
+            "FROM settlement_links AS s "
+            "WHERE t.id = s.row_id"
+        )
+        # The stage is reused for the other table in the same batch
+        cursor.execute("TRUNCATE settlement_links")
+
     # =========================================================================
     # Public API Methods
     # =========================================================================
 
+    @staticmethod
+    def compute_list_etag(
+        session: Session,
+        remittance_status: RemittanceFilter | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> str:
+        """
+        Weak ETag for the current worklog listing.
+
+        Derived from cheap COUNT/MAX aggregates over the settlement
+        tables plus the paging parameters, so any relevant data change
+        (new worklogs, segments, adjustments, or a settlement run) or a
+        different page produces a different tag without running the full
+        list query.
+        """
+        stats = session.execute(
+            sa_select(
+                select(func.count()).select_from(WorkLog).scalar_subquery(),
+                select(func.max(WorkLog.created_at)).scalar_subquery(),
+                select(func.count()).select_from(TimeSegment).scalar_subquery(),
+                select(func.max(TimeSegment.created_at)).scalar_subquery(),
+                select(func.count()).select_from(Adjustment).scalar_subquery(),
+                select(func.max(Adjustment.created_at)).scalar_subquery(),
+                select(func.count()).select_from(Remittance).scalar_subquery(),
+            )
+        ).one()
+        raw = "|".join(
+            str(part)
+            for part in (*stats, remittance_status, limit, offset, cursor)
+        )
+        return f'W/"{hashlib.md5(raw.encode()).hexdigest()}"'
+
+    @staticmethod
+    def _amounts_stmt(
+        remittance_status: RemittanceFilter | None = None,
+    ) -> Select[tuple[WorkLog, Decimal, Decimal, str]]:
+        """
+        Base SELECT joining worklogs to their pre-aggregated amounts.
+
+        Used by both the paged listing and the NDJSON stream; callers add
+        their own paging or batching on top.
+        """
+        stmt = (
+            select(
+                WorkLog,
+                col(WorkLogAmounts.remitted),
+                col(WorkLogAmounts.unremitted),
+                col(WorkLogAmounts.remittance_status),
+            )
+            .options(
+                selectinload(WorkLog.time_segments),  # type: ignore[arg-type]
+                selectinload(WorkLog.adjustments),  # type: ignore[arg-type]
+            )
+            .join(
+                WorkLogAmounts, col(WorkLogAmounts.worklog_id) == WorkLog.id
+            )
+            .order_by(col(WorkLog.created_at).desc(), col(WorkLog.id).desc())
+        )
+        if remittance_status:
+            stmt = stmt.where(
+                col(WorkLogAmounts.remittance_status) == remittance_status
+            )
+        return stmt
+
+    @staticmethod
+    def _row_to_public(
+        wl: WorkLog,
+        remitted_sum: Decimal,
+        unremitted_sum: Decimal,
+        wl_status: str,
+    ) -> WorkLogPublic:
+        """Build the public worklog model from an amounts-joined row."""
+        remitted = Decimal(remitted_sum).quantize(_TWO_PLACES)
+        unremitted = Decimal(unremitted_sum).quantize(_TWO_PLACES)
+
+        # Validate straight off the ORM row; from_attributes reads the
+        # nested segments/adjustments without an intermediate
+        # dict-building pass. The status comes from the view, which
+        # derives it with the same unremitted/total rule in SQL.
+        return WorkLogPublic.model_validate(_WorkLogWithAmounts(
+            wl,
+            WorkLogAmount(
+                remitted_amount=remitted,
+                unremitted_amount=unremitted,
+                total_amount=remitted + unremitted,
+            ),
+            wl_status,
+        ))
+
+    @staticmethod
+    def stream_worklogs(
+        session: Session,
+        remittance_status: RemittanceFilter | None = None,
+        batch_size: int = _STREAM_BATCH_SIZE,
+    ) -> Iterator[list[WorkLogPublic]]:
+        """
+        Yield worklogs in server-side cursor batches.
+
+        yield_per keeps at most one batch of rows (plus its selectin
+        payloads) in memory at a time, so peak memory is bounded by
+        batch_size rather than the full result set.
+        """
+        stmt = WorkLogService._amounts_stmt(remittance_status)
+        result = session.exec(stmt.execution_options(yield_per=batch_size))
+        for partition in result.partitions(batch_size):
+            yield [
+                WorkLogService._row_to_public(*row) for row in partition
+            ]
+
     @staticmethod
     def list_all_worklogs(
         session: Session,
-        remittance_status: str | None = None,
+        remittance_status: RemittanceFilter | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: str | None = None,
     ) -> WorkLogsPublic:
         """
-        List all worklogs with filtering and calculated amounts.
+        List worklogs with filtering, pagination, and calculated amounts.
         
         Args:
             session: Database session
             remittance_status: Filter by REMITTED or UNREMITTED
+            limit: Maximum number of worklogs per page
+            offset: Number of worklogs to skip (ignored when cursor is set)
+            cursor: Keyset cursor from a previous page's next_cursor
         
         Returns:
-            WorkLogsPublic with list of worklogs and counts
+            WorkLogsPublic with one page of worklogs, the total count, and
+            a next_cursor token when more pages remain
         """
-        # Validate filter parameter
-        valid_statuses = {"REMITTED", "UNREMITTED", None}
-        if remittance_status not in valid_statuses:
-            raise HTTPException(
-                status_code=400,
-                detail=f"remittanceStatus must be REMITTED or UNREMITTED"
+        # The filter arrives as RemittanceFilter, already validated at the
+        # request edge by FastAPI, and is applied in SQL by _amounts_stmt
+        # so LIMIT/OFFSET pages over the filtered set
+        stmt = WorkLogService._amounts_stmt(remittance_status)
+        # Keyset pagination walks the (created_at, id) ordering directly
+        # through the composite index, so deep pages cost the same as the
+        # first one; OFFSET remains as the fallback for absolute jumps.
+        # One extra row is fetched to learn whether another page exists.
+        if cursor is not None:
+            cursor_created_at, cursor_id = WorkLogService._decode_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(col(WorkLog.created_at), col(WorkLog.id))
+                < (cursor_created_at, cursor_id)
             )
-        
-        # Fetch all worklogs with relationships eager-loaded
-        worklogs = session.exec(select(WorkLog)).all()
-        
-        result: list[WorkLogPublic] = []
-        
-        for wl in worklogs:
-            remitted, unremitted, total = WorkLogService._calculate_worklog_amounts(wl)
-            
-            # Determine worklog's remittance status based on amounts
-            if unremitted > 0 or total == 0:
-                wl_status = "UNREMITTED"
-            else:
-                wl_status = "REMITTED"
-            
-            # Apply filter
-            if remittance_status and wl_status != remittance_status:
-                continue
-            
-            # Build response object
-            time_segments_data = [
-                {
-                    "id": seg.id,
-                    "start_time": seg.start_time,
-                    "end_time": seg.end_time,
-                    "status": seg.status,
-                    "settlement_status": seg.settlement_status,
-                }
-                for seg in wl.time_segments
-            ]
-            
-            adjustments_data = [
-                {
-                    "id": adj.id,
-                    "amount": adj.amount,
-                    "reason": adj.reason,
-                    "type": adj.type,
-                    "settlement_status": adj.settlement_status,
-                }
-                for adj in wl.adjustments
-            ]
-            
-            result.append(WorkLogPublic(
-                id=wl.id,
-                task_id=wl.task_id,
-                worker_id=wl.worker_id,
-                hourly_rate=wl.hourly_rate,
-                remittance_id=wl.remittance_id,
-                created_at=wl.created_at,
-                time_segments=time_segments_data,
-                adjustments=adjustments_data,
-                amounts=WorkLogAmount(
-                    remitted_amount=remitted,
-                    unremitted_amount=unremitted,
-                    total_amount=total,
-                ),
-                remittance_status=wl_status,
-            ))
-        
-        return WorkLogsPublic(data=result, count=len(result))
+        else:
+            stmt = stmt.offset(offset)
+        stmt = stmt.limit(limit + 1)
+        # The count comes straight off the aggregate table (one row per
+        # worklog), so no join or row fetch is needed
+        count_stmt = select(func.count()).select_from(WorkLogAmounts)
+        if remittance_status:
+            count_stmt = count_stmt.where(
+                col(WorkLogAmounts.remittance_status) == remittance_status
+            )
+
+        count = session.exec(count_stmt).one()
+        rows = session.exec(stmt).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        result = [WorkLogService._row_to_public(*row) for row in rows]
+
+        next_cursor = None
+        if has_more:
+            last = rows[-1][0]
+            next_cursor = WorkLogService._encode_cursor(last.created_at, last.id)
+
+        return WorkLogsPublic(data=result, count=count, next_cursor=next_cursor)
+
+    @staticmethod
+    def worklog_summary(session: Session) -> WorkLogSummary:
+        """
+        Aggregate settlement totals for all worklogs.
+
+        Reads worklog_amounts, which the sync triggers keep in step with
+        settlement activity, so the summary is a single small aggregate
+        over one row per worklog — no segment or adjustment scan.
+        """
+        total, remitted_count, unremitted_count, unremitted_amount = (
+            session.exec(
+                select(
+                    func.count(),
+                    func.count().filter(
+                        col(WorkLogAmounts.remittance_status) == "REMITTED"
+                    ),
+                    func.count().filter(
+                        col(WorkLogAmounts.remittance_status) == "UNREMITTED"
+                    ),
+                    func.coalesce(func.sum(WorkLogAmounts.unremitted), 0),
+                ).select_from(WorkLogAmounts)
+            ).one()
+        )
+        return WorkLogSummary(
+            total=total,
+            remitted_count=remitted_count,
+            unremitted_count=unremitted_count,
+            total_unremitted_amount=Decimal(unremitted_amount).quantize(
+                _TWO_PLACES
+            ),
+        )
 
     @staticmethod
     def generate_remittances(
         session: Session,
         request: GenerateRemittancesRequest,
+        idempotency_key: str | None = None,
     ) -> GenerateRemittancesResponse:
         """
         Generate remittances for all users with outstanding payments.
@@ -235,6 +601,8 @@ class WorkLogService:
         Args:
             session: Database session
             request: Configuration for remittance generation
+            idempotency_key: Client-supplied key; a repeated key replays
+                the stored response instead of settling again
         
         Returns:
             GenerateRemittancesResponse with created remittances
@@ -243,6 +611,28 @@ class WorkLogService:
         period_start, period_end = WorkLogService._resolve_period(
             request.period_start, request.period_end
         )
+
+        # A retried request must not double-settle: replay the response
+        # recorded by the original run — but only for the same request. A
+        # reused key with different parameters is a client bug; answering
+        # it with the old response would silently skip settling the new
+        # period, so it conflicts instead. Dry runs persist nothing and
+        # bypass the guard.
+        fingerprint = WorkLogService._request_fingerprint(
+            period_start, period_end, request.payout_status
+        )
+        if idempotency_key is not None and not request.dry_run:
+            cached = session.get(RemittanceIdempotency, idempotency_key)
+            if cached is not None:
+                if cached.request_fingerprint != fingerprint:
+                    raise HTTPException(
+                        status_code=409,
+                        detail="Idempotency-Key was already used with "
+                        "different settlement parameters",
+                    )
+                return GenerateRemittancesResponse.model_validate_json(
+                    cached.payload
+                )
         
         # Convert to datetime for comparison with timestamps
         period_start_dt = datetime.combine(period_start, datetime.min.time()).replace(
@@ -252,167 +642,266 @@ class WorkLogService:
             tzinfo=timezone.utc
         )
         
-        # Fetch unremitted segments
-        unremitted_segments = session.exec(
-            select(TimeSegment).where(
-                TimeSegment.status == TimeSegmentStatus.ACTIVE,
-                TimeSegment.settlement_status == SettlementStatus.UNREMITTED,
-            )
-        ).all()
-        
-        # Fetch unremitted adjustments
-        unremitted_adjustments = session.exec(
-            select(Adjustment).where(
-                Adjustment.settlement_status == SettlementStatus.UNREMITTED
-            )
-        ).all()
-        
-        # Group by worker
-        worker_segments: dict[uuid.UUID, list[tuple[TimeSegment, WorkLog]]] = defaultdict(list)
-        worker_adjustments: dict[uuid.UUID, list[tuple[Adjustment, WorkLog]]] = defaultdict(list)
-        worklog_cache: dict[uuid.UUID, WorkLog] = {}
-        
-        for seg in unremitted_segments:
-            if seg.worklog_id not in worklog_cache:
-                wl = session.exec(
-                    select(WorkLog).where(WorkLog.id == seg.worklog_id)
-                ).first()
-                if wl:
-                    worklog_cache[seg.worklog_id] = wl
-            
-            wl = worklog_cache.get(seg.worklog_id)
-            if wl:
-                worker_segments[wl.worker_id].append((seg, wl))
-        
-        for adj in unremitted_adjustments:
-            if adj.worklog_id not in worklog_cache:
-                wl = session.exec(
-                    select(WorkLog).where(WorkLog.id == adj.worklog_id)
-                ).first()
-                if wl:
-                    worklog_cache[adj.worklog_id] = wl
-            
-            wl = worklog_cache.get(adj.worklog_id)
-            if wl:
-                worker_adjustments[wl.worker_id].append((adj, wl))
-        
-        # Get all unique worker IDs
-        all_worker_ids = set(worker_segments.keys()) | set(worker_adjustments.keys())
-        
+        # Filters shared by the worker scan and the per-batch row fetches;
+        # restricted to work that finished within the requested period so
+        # the queries scale with the period rather than full history
+        segment_filters = (
+            TimeSegment.status == TimeSegmentStatus.ACTIVE,
+            TimeSegment.settlement_status == SettlementStatus.UNREMITTED,
+            TimeSegment.end_time >= period_start_dt,
+            TimeSegment.end_time <= period_end_dt,
+        )
+        adjustment_filters = (
+            Adjustment.settlement_status == SettlementStatus.UNREMITTED,
+            Adjustment.created_at >= period_start_dt,
+            Adjustment.created_at <= period_end_dt,
+        )
+
+        # Only the distinct worker ids are fetched up front; the row data
+        # itself is loaded per batch below, so peak memory holds one
+        # batch's segments and adjustments rather than the whole period's.
+        # TimeSegment.worker_id is nullable (the denormalizing trigger
+        # fills it), so NULLs are excluded in SQL and the result narrows
+        # to plain UUIDs
+        all_worker_ids: set[uuid.UUID] = {
+            worker_id
+            for worker_id in session.exec(
+                select(TimeSegment.worker_id)
+                .where(*segment_filters)
+                .where(col(TimeSegment.worker_id).is_not(None))
+                .distinct()
+            ).all()
+            if worker_id is not None
+        } | set(
+            session.exec(
+                select(WorkLog.worker_id)
+                .join(Adjustment, col(Adjustment.worklog_id) == WorkLog.id)
+                .where(*adjustment_filters)
+                .distinct()
+            ).all()
+        )
+
+        # Group key for itertools.groupby over worker-ordered rows: one
+        # linear pass, no per-row dict hashing or appends
+        def _worker_of(row: tuple[Any, WorkLog]) -> uuid.UUID:
+            return row[1].worker_id
+
         remittances_created: list[RemittancePublic] = []
-        total_gross = Decimal("0")
-        total_net = Decimal("0")
+        total_gross_cents = 0
+        total_net_cents = 0
         now = datetime.now(timezone.utc)
-        
-        for worker_id in all_worker_ids:
-            segments = worker_segments.get(worker_id, [])
-            adjustments = worker_adjustments.get(worker_id, [])
-            
-            # Calculate gross (positive amounts only) and net
-            gross_amount = Decimal("0")
-            net_amount = Decimal("0")
-            worklog_ids: set[uuid.UUID] = set()
+
+        # Workers are settled in fixed-size batches, each committed on its
+        # own: locks on segment and adjustment rows are held only for one
+        # batch, row data and statement-row memory are bounded by the
+        # batch size, and a failure rolls back just the batch in flight
+        worker_ids = list(all_worker_ids)
+        for batch_start in range(0, len(worker_ids), _SETTLEMENT_BATCH_SIZE):
+            worker_batch = worker_ids[
+                batch_start : batch_start + _SETTLEMENT_BATCH_SIZE
+            ]
+
+            # Workers another settlement run currently owns are left for
+            # that run; their rows stay unremitted and the next run picks
+            # them up. Dry runs write nothing, so they skip the locks.
+            if not request.dry_run:
+                owned = WorkLogService._acquire_worker_locks(
+                    session, worker_batch
+                )
+                worker_batch = [
+                    worker_id
+                    for worker_id in worker_batch
+                    if worker_id in owned
+                ]
+            if not worker_batch:
+                continue
+
+            # Fetch this batch's unremitted segments with their worklogs
+            # in one JOIN, ordered by worker so per-worker groups fall out
+            # of a linear pass
+            segment_rows = session.exec(
+                select(TimeSegment, WorkLog)
+                .join(WorkLog, col(WorkLog.id) == TimeSegment.worklog_id)
+                .where(
+                    *segment_filters,
+                    col(TimeSegment.worker_id).in_(worker_batch),
+                )
+                # The denormalized copy lets the partial (worker_id,
+                # end_time) index drive the per-worker ordering without
+                # the join
+                .order_by(col(TimeSegment.worker_id))
+            ).all()
+            adjustment_rows = session.exec(
+                select(Adjustment, WorkLog)
+                .join(WorkLog, col(WorkLog.id) == Adjustment.worklog_id)
+                .where(
+                    *adjustment_filters,
+                    col(WorkLog.worker_id).in_(worker_batch),
+                )
+                .order_by(col(WorkLog.worker_id))
+            ).all()
+
+            worker_segments: dict[
+                uuid.UUID, list[tuple[TimeSegment, WorkLog, Decimal]]
+            ] = {
+                worker_id: [
+                    # Compute the amount once here; it is reused for both
+                    # the gross/net sums and the worklog running-total
+                    # deltas
+                    (
+                        seg,
+                        wl,
+                        WorkLogService._calculate_segment_amount(
+                            seg, wl.hourly_rate
+                        ),
+                    )
+                    for seg, wl in group
+                ]
+                for worker_id, group in groupby(segment_rows, key=_worker_of)
+            }
+            worker_adjustments: dict[
+                uuid.UUID, list[tuple[Adjustment, WorkLog]]
+            ] = {
+                worker_id: list(group)
+                for worker_id, group in groupby(adjustment_rows, key=_worker_of)
+            }
+
+            # Rows and link lists for this batch's INSERT/UPDATE
+            # statements; remittance IDs are pre-generated so no per-row
+            # flush is needed
+            remittance_rows: list[dict[str, Any]] = []
+            segment_links: dict[uuid.UUID, list[uuid.UUID]] = {}
+            adjustment_links: dict[uuid.UUID, list[uuid.UUID]] = {}
+            worklog_deltas: dict[uuid.UUID, Decimal] = defaultdict(
+                lambda: _ZERO
+            )
+            worklog_remittance_ids: dict[uuid.UUID, uuid.UUID] = {}
+
+            for worker_id in worker_batch:
+                segments = worker_segments.get(worker_id, [])
+                adjustments = worker_adjustments.get(worker_id, [])
             
-            for seg, wl in segments:
-                amount = WorkLogService._calculate_segment_amount(seg, wl.hourly_rate)
-                net_amount += amount
-                if amount > 0:
-                    gross_amount += amount
-                worklog_ids.add(wl.id)
+                # Calculate gross (positive amounts only) and net, summing as
+                # integer cents: amounts are already quantized to two places,
+                # and int addition is far cheaper than Decimal addition per row
+                gross_cents = 0
+                net_cents = 0
+                worklog_ids: set[uuid.UUID] = set()
             
-            for adj, wl in adjustments:
-                net_amount += adj.amount
-                if adj.amount > 0:
-                    gross_amount += adj.amount
-                worklog_ids.add(wl.id)
+                for _seg, wl, amount in segments:
+                    amount_cents = int(amount.scaleb(2))
+                    net_cents += amount_cents
+                    if amount_cents > 0:
+                        gross_cents += amount_cents
+                    worklog_ids.add(wl.id)
             
-            # Skip if nothing to settle
-            if gross_amount == 0 and net_amount == 0:
-                continue
+                for adj, wl in adjustments:
+                    amount_cents = int(adj.amount.scaleb(2))
+                    net_cents += amount_cents
+                    if amount_cents > 0:
+                        gross_cents += amount_cents
+                    worklog_ids.add(wl.id)
             
-            # Determine status based on request or defaults
-            status = request.payout_status or RemittanceStatus.COMPLETED
-            failure_reason = None
-            if status in {RemittanceStatus.FAILED, RemittanceStatus.CANCELLED}:
-                failure_reason = f"Payout marked as {status.value} by request"
+                # Skip if nothing to settle
+                if gross_cents == 0 and net_cents == 0:
+                    continue
             
-            # Create remittance
-            remittance = Remittance(
-                worker_id=worker_id,
-                gross_amount=gross_amount.quantize(Decimal("0.01")),
-                net_amount=net_amount.quantize(Decimal("0.01")),
-                status=status,
-                failure_reason=failure_reason,
-                period_start=period_start_dt,
-                period_end=period_end_dt,
-                processed_at=now if status == RemittanceStatus.COMPLETED else None,
-            )
+                # Determine status based on request or defaults
+                status = request.payout_status or RemittanceStatus.COMPLETED
+                failure_reason = None
+                if status in {RemittanceStatus.FAILED, RemittanceStatus.CANCELLED}:
+                    failure_reason = f"Payout marked as {status.value} by request"
             
-            if request.dry_run:
-                # In dry-run mode, don't persist anything
+                remittance_id = uuid.uuid4()
+                gross_quantized = Decimal(gross_cents).scaleb(-2)
+                net_quantized = Decimal(net_cents).scaleb(-2)
+
+                if not request.dry_run:
+                    remittance_rows.append({
+                        "id": remittance_id,
+                        "worker_id": worker_id,
+                        "gross_amount": gross_quantized,
+                        "net_amount": net_quantized,
+                        "status": status,
+                        "failure_reason": failure_reason,
+                        "period_start": period_start_dt,
+                        "period_end": period_end_dt,
+                        "created_at": now,
+                        "processed_at": now if status == RemittanceStatus.COMPLETED else None,
+                    })
+
+                    # Collect link/delta rows for the batched UPDATEs
+                    # (only successful payouts settle the underlying rows)
+                    if status == RemittanceStatus.COMPLETED:
+                        segment_links[remittance_id] = [seg.id for seg, _, _ in segments]
+                        adjustment_links[remittance_id] = [adj.id for adj, _ in adjustments]
+                        for _seg, wl, amount in segments:
+                            worklog_deltas[wl.id] += amount
+                            worklog_remittance_ids[wl.id] = remittance_id
+                        for adj, wl in adjustments:
+                            worklog_deltas[wl.id] += adj.amount
+
                 remittances_created.append(RemittancePublic(
-                    id=uuid.uuid4(),  # Fake ID for preview
+                    id=remittance_id,
                     worker_id=worker_id,
-                    gross_amount=remittance.gross_amount,
-                    net_amount=remittance.net_amount,
-                    status=remittance.status,
+                    gross_amount=gross_quantized,
+                    net_amount=net_quantized,
+                    status=status,
                     worklogs_count=len(worklog_ids),
                     period_start=period_start,
                     period_end=period_end,
                 ))
-                total_gross += gross_amount
-                total_net += net_amount
-                continue
-            
-            # Persist remittance
-            session.add(remittance)
-            session.flush()  # Get the ID
-            
-            # Mark segments as remitted (only if status is successful)
-            if status == RemittanceStatus.COMPLETED:
-                for seg, wl in segments:
-                    seg.settlement_status = SettlementStatus.REMITTED
-                    seg.remittance_id = remittance.id
-                    session.add(seg)
-                    
-                    # Update worklog's total remitted amount
-                    amount = WorkLogService._calculate_segment_amount(seg, wl.hourly_rate)
-                    wl.total_remitted_amount += amount
-                    wl.remittance_id = remittance.id
-                    session.add(wl)
-                
-                for adj, wl in adjustments:
-                    adj.settlement_status = SettlementStatus.REMITTED
-                    adj.remittance_id = remittance.id
-                    session.add(adj)
-                    
-                    # Update worklog's total remitted amount
-                    wl.total_remitted_amount += adj.amount
-                    session.add(wl)
-            
-            remittances_created.append(RemittancePublic(
-                id=remittance.id,
-                worker_id=remittance.worker_id,
-                gross_amount=remittance.gross_amount,
-                net_amount=remittance.net_amount,
-                status=remittance.status,
-                worklogs_count=len(worklog_ids),
-                period_start=period_start,
-                period_end=period_end,
-            ))
-            
-            total_gross += gross_amount
-            total_net += net_amount
-        
-        if not request.dry_run:
-            session.commit()
-        
-        return GenerateRemittancesResponse(
+
+                total_gross_cents += gross_cents
+                total_net_cents += net_cents
+
+            if not request.dry_run and remittance_rows:
+                WorkLogService._persist_remittances(
+                    session,
+                    remittance_rows=remittance_rows,
+                    segment_links=segment_links,
+                    adjustment_links=adjustment_links,
+                    worklog_deltas=worklog_deltas,
+                    worklog_remittance_ids=worklog_remittance_ids,
+                )
+                session.commit()
+
+        response = GenerateRemittancesResponse(
             remittances_created=len(remittances_created),
-            total_gross_amount=total_gross.quantize(Decimal("0.01")),
-            total_net_amount=total_net.quantize(Decimal("0.01")),
+            total_gross_amount=Decimal(total_gross_cents).scaleb(-2),
+            total_net_amount=Decimal(total_net_cents).scaleb(-2),
             remittances=remittances_created,
             dry_run=request.dry_run,
             period_start=period_start,
             period_end=period_end,
         )
+
+        if not request.dry_run and idempotency_key is not None:
+            # Recorded once all batches have committed; a crash mid-run
+            # leaves the key unset, so the retry resumes with whatever is
+            # still unremitted rather than double-paying
+            session.add(RemittanceIdempotency(
+                key=idempotency_key,
+                request_fingerprint=fingerprint,
+                payload=response.model_dump_json(),
+            ))
+            try:
+                session.commit()
+            except IntegrityError:
+                # A concurrent run with the same key committed first;
+                # hand back its stored response (same-request keys only)
+                session.rollback()
+                cached = session.get(RemittanceIdempotency, idempotency_key)
+                if cached is None:
+                    raise
+                if cached.request_fingerprint != fingerprint:
+                    raise HTTPException(
+                        status_code=409,
+                        detail="Idempotency-Key was already used with "
+                        "different settlement parameters",
+                    )
+                return GenerateRemittancesResponse.model_validate_json(
+                    cached.payload
+                )
+
+        return response
@@ -8,26 +8,91 @@ Implements senior developer best practices:
 - Comprehensive documentation
 - Type safety with Pydantic
 """
+import math
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterator
+from functools import partial
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query
+import anyio.to_thread
+from cachetools import TTLCache
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 
 from app.api.deps import SessionDep, get_current_active_superuser
+from app.api.routes.worklog import jobs
 from app.api.routes.worklog.schemas import (
     GenerateRemittancesRequest,
     GenerateRemittancesResponse,
+    RemittanceFilter,
+    RemittanceJobPublic,
+    WorkLogPublic,
     WorkLogsPublic,
+    WorkLogSummary,
 )
 from app.api.routes.worklog.service import WorkLogService
+from app.core.config import settings
+from app.models import User
 
 router = APIRouter(prefix="/worklogs", tags=["worklogs"])
 
+# Short-lived cache of serialized list pages. Keys include the list ETag,
+# so any data change (which changes the tag) misses immediately; the TTL
+# only bounds how long identical bursts share one DB round-trip.
+_ListCacheKey = tuple[RemittanceFilter | None, int, int, str | None, str]
+_list_cache: TTLCache[_ListCacheKey, bytes] = TTLCache(maxsize=128, ttl=5)
+_list_cache_lock = threading.Lock()
 
-@router.get(
-    "/list-all-worklogs",
-    response_model=WorkLogsPublic,
-    summary="List all worklogs with amounts",
-    description="""
+# Last settlement-run timestamp per user (monotonic clock); backs the
+# per-user throttle on the generate endpoint so retry storms can't pile
+# long-running runs on top of each other
+_settlement_last_run: dict[uuid.UUID, float] = {}
+_settlement_rate_lock = threading.Lock()
+
+
+def _enforce_settlement_rate_limit(
+    current_user: User = Depends(get_current_active_superuser),
+) -> None:
+    """Allow at most one settlement run per user per configured window.
+
+    Raises 429 with a Retry-After header when a user triggers another
+    run inside the window; a window of 0 disables the throttle.
+    """
+    window = settings.WORKLOG_SETTLEMENT_RATE_LIMIT_SECONDS
+    if window <= 0:
+        return
+    now = time.monotonic()
+    with _settlement_rate_lock:
+        last = _settlement_last_run.get(current_user.id)
+        if last is not None and now - last < window:
+            retry_after = math.ceil(window - (now - last))
+            raise HTTPException(
+                status_code=429,
+                detail="Settlement was triggered recently; retry later",
+                headers={"Retry-After": str(retry_after)},
+            )
+        _settlement_last_run[current_user.id] = now
+
+
+# One-shot serializer reused for every stream line; pydantic-core dumps
+# straight to JSON bytes, with no intermediate dict pass per row
+_WORKLOG_ADAPTER: TypeAdapter[WorkLogPublic] = TypeAdapter(WorkLogPublic)
+
+# Route descriptions, built once at import time instead of inline in the
+# decorators; they only feed the OpenAPI schema
+_LIST_ALL_WORKLOGS_DESC = """
     Lists all worklogs with calculated amounts and filtering options.
     
     Each worklog includes:
@@ -39,34 +104,25 @@ router = APIRouter(prefix="/worklogs", tags=["worklogs"])
     **Filtering:**
     - `remittanceStatus=REMITTED`: Only fully paid worklogs
     - `remittanceStatus=UNREMITTED`: Worklogs with unpaid amounts
-    """,
-)
-def list_all_worklogs(
-    session: SessionDep,
-    remittanceStatus: str | None = Query(
-        default=None,
-        description="Filter by remittance status: REMITTED or UNREMITTED",
-        examples=["REMITTED", "UNREMITTED"],
-    ),
-) -> Any:
     """
-    List all worklogs with filtering and amount information.
-    
-    Returns worklogs with their time segments, adjustments, and
-    calculated amounts broken down by remitted/unremitted status.
+
+_STREAM_WORKLOGS_DESC = """
+    Streams every worklog (with segments, adjustments, and amounts) as
+    newline-delimited JSON, one worklog per line.
+
+    Rows are fetched in server-side cursor batches, so memory stays flat
+    regardless of how many worklogs exist. Intended for exports and bulk
+    consumers; interactive clients should use the paged listing.
     """
-    return WorkLogService.list_all_worklogs(
-        session=session,
-        remittance_status=remittanceStatus,
-    )
 
+_SUMMARY_DESC = """
+    Returns worklog counts by remittance status and the total unpaid
+    amount, computed from the pre-aggregated per-worklog amounts.
 
-@router.post(
-    "/generate-remittances-for-all-users",
-    response_model=GenerateRemittancesResponse,
-    dependencies=[Depends(get_current_active_superuser)],
-    summary="Generate remittances for all users",
-    description="""
+    Cheap enough to poll: one small aggregate query, no list fetch.
+    """
+
+_GENERATE_REMITTANCES_DESC = """
     Generates remittances for all users with outstanding (unremitted) work.
     
     **Key Features:**
@@ -82,13 +138,184 @@ def list_all_worklogs(
     4. Creates remittance records
     5. Links segments/adjustments to their remittance
     6. Updates worklog running totals
-    
+
+    By default the run is queued and a 202 with a task id is returned;
+    poll `GET /worklogs/remittance-jobs/{task_id}` for the outcome, or
+    pass `?sync=true` to run in the request and get the full result.
+
     **Requires:** Superuser authentication
-    """,
+
+    Runs are throttled per user: triggering another run inside the
+    configured window returns 429 with a Retry-After header.
+    """
+
+_REMITTANCE_JOB_DESC = """
+    Returns the status of a settlement job queued by
+    generate-remittances-for-all-users, including the full result once
+    it has completed or the failure detail if it did not.
+
+    **Requires:** Superuser authentication
+    """
+
+
+@router.get(
+    "/list-all-worklogs",
+    responses={200: {"model": WorkLogsPublic}},
+    summary="List all worklogs with amounts",
+    description=_LIST_ALL_WORKLOGS_DESC,
+)
+async def list_all_worklogs(
+    request: Request,
+    session: SessionDep,
+    remittanceStatus: RemittanceFilter | None = Query(
+        default=None,
+        description="Filter by remittance status: REMITTED or UNREMITTED",
+        examples=["REMITTED", "UNREMITTED"],
+    ),
+    limit: int = Query(
+        default=100, ge=1, le=1000, description="Maximum worklogs per page"
+    ),
+    offset: int = Query(
+        default=0, ge=0, description="Number of worklogs to skip"
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="Keyset cursor from a previous page's next_cursor",
+    ),
+) -> Any:
+    """
+    List worklogs with filtering, pagination, and amount information.
+
+    Returns one page of worklogs with their time segments, adjustments,
+    and calculated amounts broken down by remitted/unremitted status.
+    The count field reflects the total number of matching worklogs.
+
+    Supports conditional requests: responses carry a weak ETag, and a
+    matching If-None-Match short-circuits to 304 before the list query.
+    """
+    # The service uses a sync Session, so run it on a worker thread and
+    # keep the event loop free instead of tying up Starlette's shared
+    # sync-endpoint threadpool for the whole request
+    etag = await anyio.to_thread.run_sync(
+        partial(
+            WorkLogService.compute_list_etag,
+            session=session,
+            remittance_status=remittanceStatus,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+    )
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    cache_key = (remittanceStatus, limit, offset, cursor, etag)
+    with _list_cache_lock:
+        payload = _list_cache.get(cache_key)
+
+    if payload is None:
+        result = await anyio.to_thread.run_sync(
+            partial(
+                WorkLogService.list_all_worklogs,
+                session=session,
+                remittance_status=remittanceStatus,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+            )
+        )
+        # Serialize in one pydantic-core pass to bytes; no intermediate
+        # dict walk and no separate JSON encoder
+        payload = result.model_dump_json().encode()
+        with _list_cache_lock:
+            _list_cache[cache_key] = payload
+
+    # Returning the response directly skips FastAPI's jsonable_encoder
+    # walk and response-model re-validation
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "private, must-revalidate"},
+    )
+
+
+@router.get(
+    "/list-all-worklogs/stream",
+    summary="Stream all worklogs as NDJSON",
+    description=_STREAM_WORKLOGS_DESC,
 )
-def generate_remittances_for_all_users(
+async def stream_all_worklogs(
     session: SessionDep,
+    remittanceStatus: RemittanceFilter | None = Query(
+        default=None,
+        description="Filter by remittance status: REMITTED or UNREMITTED",
+        examples=["REMITTED", "UNREMITTED"],
+    ),
+) -> Any:
+    """
+    Stream worklogs as NDJSON without materializing the full list.
+
+    Each line is one serialized worklog in the same shape as the paged
+    listing's data entries.
+    """
+
+    async def generate() -> AsyncIterator[bytes]:
+        # The async generator keeps the event loop in charge of
+        # backpressure; only the blocking batch fetch hops to a worker
+        # thread
+        batches = WorkLogService.stream_worklogs(
+            session=session, remittance_status=remittanceStatus
+        )
+        while True:
+            batch = await anyio.to_thread.run_sync(next, batches, None)
+            if batch is None:
+                return
+            for worklog in batch:
+                yield _WORKLOG_ADAPTER.dump_json(worklog) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/summary",
+    responses={200: {"model": WorkLogSummary}},
+    summary="Aggregate settlement totals",
+    description=_SUMMARY_DESC,
+)
+async def worklog_summary(session: SessionDep) -> Any:
+    """Return aggregate settlement totals across all worklogs."""
+    result = await anyio.to_thread.run_sync(
+        partial(WorkLogService.worklog_summary, session=session)
+    )
+    return ORJSONResponse(result.model_dump(mode="json"))
+
+
+@router.post(
+    "/generate-remittances-for-all-users",
+    responses={200: {"model": GenerateRemittancesResponse}},
+    dependencies=[Depends(_enforce_settlement_rate_limit)],
+    summary="Generate remittances for all users",
+    description=_GENERATE_REMITTANCES_DESC,
+)
+async def generate_remittances_for_all_users(
+    session: SessionDep,
+    background_tasks: BackgroundTasks,
     body: GenerateRemittancesRequest | None = None,
+    sync: bool = Query(
+        default=False,
+        description="Run settlement in the request and return the full "
+        "result instead of queueing a job",
+    ),
+    dryRun: bool = Query(
+        default=False,
+        description="Preview the run without persisting (same as body dry_run)",
+    ),
+    idempotency_key: str | None = Header(
+        default=None,
+        alias="Idempotency-Key",
+        description="Replay guard: a repeated key returns the original "
+        "response without settling again",
+    ),
 ) -> Any:
     """
     Generate remittances for all eligible workers.
@@ -99,7 +326,45 @@ def generate_remittances_for_all_users(
     Supports dry-run mode to preview without persisting.
     """
     request = body or GenerateRemittancesRequest()
-    return WorkLogService.generate_remittances(
-        session=session,
-        request=request,
+    if dryRun:
+        request.dry_run = True
+
+    if not sync:
+        # Queue the run and free the HTTP worker immediately; the job
+        # executes on a background task with its own session and is
+        # observable via the status endpoint
+        task_id = jobs.create_job()
+        background_tasks.add_task(
+            jobs.run_generate_remittances, task_id, request, idempotency_key
+        )
+        return ORJSONResponse(
+            status_code=202,
+            content={
+                "task_id": task_id,
+                "status_url": (
+                    f"{settings.API_V1_STR}/worklogs/remittance-jobs/{task_id}"
+                ),
+            },
+        )
+
+    result = await anyio.to_thread.run_sync(
+        partial(
+            WorkLogService.generate_remittances,
+            session=session,
+            request=request,
+            idempotency_key=idempotency_key,
+        )
     )
+    return ORJSONResponse(result.model_dump(mode="json"))
+
+
+@router.get(
+    "/remittance-jobs/{task_id}",
+    responses={200: {"model": RemittanceJobPublic}},
+    dependencies=[Depends(get_current_active_superuser)],
+    summary="Poll a queued settlement run",
+    description=_REMITTANCE_JOB_DESC,
+)
+async def get_remittance_job(task_id: str) -> Any:
+    """Return the current status and outcome of a settlement job."""
+    return ORJSONResponse(jobs.get_job(task_id).model_dump(mode="json"))
@@ -55,6 +55,16 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = ""
+    # Client-side connection pool; ignored when an external pooler
+    # (PgBouncer in transaction mode) holds the server connections
+    DATABASE_USE_EXTERNAL_POOLER: bool = False
+    DATABASE_POOL_SIZE: int = 20
+    DATABASE_MAX_OVERFLOW: int = 0
+    DATABASE_POOL_PRE_PING: bool = False
+
+    # Minimum seconds between settlement runs per user; 0 disables the
+    # throttle
+    WORKLOG_SETTLEMENT_RATE_LIMIT_SECONDS: int = 60
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -1,10 +1,26 @@
+from typing import Any
+
+from sqlalchemy.pool import NullPool
 from sqlmodel import Session, create_engine, select
 
 from app import crud
 from app.core.config import settings
 from app.models import User, UserCreate
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+
+def _engine_kwargs() -> dict[str, Any]:
+    if settings.DATABASE_USE_EXTERNAL_POOLER:
+        # PgBouncer (or similar) already pools server connections; a
+        # client-side pool on top would only pin bouncer slots
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+
+
+engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI), **_engine_kwargs())
 
 
 # make sure all SQLModel models are imported (app.models) before initializing DB
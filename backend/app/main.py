@@ -1,7 +1,9 @@
 import sentry_sdk
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 
 from app.api.main import api_router
 from app.core.config import settings
@@ -18,8 +20,13 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    default_response_class=ORJSONResponse,
 )
 
+# Compress JSON-heavy responses (worklog listings repeat the same keys
+# per row); small bodies pass through untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Set all CORS enabled origins
 if settings.all_cors_origins:
     app.add_middleware(
@@ -31,3 +38,8 @@ if settings.all_cors_origins:
     )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
+
+# Build the OpenAPI schema once at startup; FastAPI otherwise generates
+# it on the first /openapi.json request and this pins the cost to import
+# time instead of a request
+app.openapi_schema = app.openapi()
@@ -0,0 +1,714 @@
+from collections.abc import Generator
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.api.routes.worklog.models import (
+    AdjustmentType,
+    Remittance,
+    SettlementStatus,
+    TimeSegment,
+    TimeSegmentStatus,
+    WorkLog,
+)
+from app.api.routes.worklog import views
+from app.core.config import settings
+from tests.utils.worklog import (
+    PERIOD_END,
+    PERIOD_START,
+    SEGMENT_START,
+    add_adjustment,
+    add_segment,
+    clear_worklog_data,
+    create_worklog,
+)
+
+PERIOD_BODY = {"period_start": "2026-01-01", "period_end": "2026-01-31"}
+SYNC_PARAMS = {"sync": "true"}
+
+
+@pytest.fixture(autouse=True)
+def clean_worklogs(db: Session) -> Generator[None, None, None]:
+    # Disable the per-user settlement throttle so tests can settle
+    # repeatedly; the rate-limit test re-enables it explicitly
+    original_window = settings.WORKLOG_SETTLEMENT_RATE_LIMIT_SECONDS
+    settings.WORKLOG_SETTLEMENT_RATE_LIMIT_SECONDS = 0
+    views._settlement_last_run.clear()
+    clear_worklog_data(db)
+    yield
+    settings.WORKLOG_SETTLEMENT_RATE_LIMIT_SECONDS = original_window
+    clear_worklog_data(db)
+
+
+def amount(value: float | str) -> Decimal:
+    """Normalize a JSON amount (float or string) for comparison."""
+    return Decimal(str(value))
+
+
+def test_list_worklogs_empty(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/worklogs/list-all-worklogs",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["data"] == []
+    assert content["count"] == 0
+
+
+def test_list_worklogs_amounts(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    worklog = create_worklog(db, hourly_rate=Decimal("100.00"))
+    add_segment(db, worklog, hours=2)
+    add_adjustment(db, worklog, amount=Decimal("50.00"))
+    response = client.get(
+        f"{settings.API_V1_STR}/worklogs/list-all-worklogs",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["count"] == 1
+    entry = content["data"][0]
+    assert entry["id"] == str(worklog.id)
+    assert len(entry["time_segments"]) == 1
+    assert len(entry["adjustments"]) == 1
+    assert amount(entry["amounts"]["remitted_amount"]) == Decimal("0")
+    assert amount(entry["amounts"]["unremitted_amount"]) == Decimal("250.00")
+    assert amount(entry["amounts"]["total_amount"]) == Decimal("250.00")
+    assert entry["remittance_status"] == "UNREMITTED"
+
+
+def test_list_worklogs_ignores_removed_segments(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    worklog = create_worklog(db, hourly_rate=Decimal("100.00"))
+    add_segment(db, worklog, hours=1)
+    add_segment(db, worklog, hours=3, status=TimeSegmentStatus.REMOVED)
+    response = client.get(
+        f"{settings.API_V1_STR}/worklogs/list-all-worklogs",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    entry = response.json()["data"][0]
+    assert amount(entry["amounts"]["total_amount"]) == Decimal("100.00")
+
+
+def test_list_amounts_match_python_reference(db: Session) -> None:
+    from app.api.routes.worklog.schemas import GenerateRemittancesRequest
+    from app.api.routes.worklog.service import WorkLogService
+
+    worklog = create_worklog(db, hourly_rate=Decimal("75.50"))
+    add_segment(db, worklog, hours=2)
+    add_adjustment(
+        db, worklog, amount=Decimal("-5.00"), type=AdjustmentType.DEDUCTION
+    )
+
+    # Settle through the service so total_remitted_amount tracks the
+    # paid total, then add fresh unremitted work on top
+    WorkLogService.generate_remittances(
+        session=db,
+        request=GenerateRemittancesRequest(
+            period_start=PERIOD_START, period_end=PERIOD_END
+        ),
+    )
+    add_segment(db, worklog, hours=1.5)
+    add_segment(db, worklog, hours=4, status=TimeSegmentStatus.DISPUTED)
+    add_adjustment(db, worklog, amount=Decimal("12.34"))
+
+    result = WorkLogService.list_all_worklogs(session=db)
+    assert result.count == 1
+    entry = result.data[0]
+
+    worklog_db = db.get(WorkLog, worklog.id)
+    assert worklog_db is not None
+    remitted, unremitted, total = WorkLogService._calculate_worklog_amounts(worklog_db)
+    assert entry.amounts.remitted_amount == remitted
+    assert entry.amounts.unremitted_amount == unremitted
+    assert entry.amounts.total_amount == total
+
+
+def test_amounts_serialize_as_strings(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    """Money fields travel as JSON strings, never floats."""
+    worklog = create_worklog(db, hourly_rate=Decimal("75.50"))
+    add_segment(db, worklog, hours=2)
+
+    listing = client.get(
+        f"{settings.API_V1_STR}/worklogs/list-all-worklogs",
+        headers=superuser_token_headers,
+    )
+    entry = listing.json()["data"][0]
+    assert isinstance(entry["hourly_rate"], str)
+    assert isinstance(entry["amounts"]["total_amount"], str)
+    assert entry["amounts"]["total_amount"] == "151.00"
+
+    settled = client.post(
+        f"{settings.API_V1_STR}/worklogs/generate-remittances-for-all-users",
+        headers=superuser_token_headers,
+        params=SYNC_PARAMS,
+        json=PERIOD_BODY,
+    )
+    content = settled.json()
+    assert isinstance(content["total_net_amount"], str)
+    assert isinstance(content["remittances"][0]["gross_amount"], str)
+
+
+def test_list_worklogs_filter(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    unremitted = create_worklog(db)
+    add_segment(db, unremitted, hours=1)
+    remitted = create_worklog(db)
+    add_segment(db, remitted, hours=1, settlement_status=SettlementStatus.REMITTED)
+    response = client.get(
+        f"{settings.API_V1_STR}/worklogs/list-all-worklogs",
+        headers=superuser_token_headers,
+        params={"remittanceStatus": "UNREMITTED"},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert [entry["id"] for entry in content["data"]] == [str(unremitted.id)]
+
+    response = client.get(
+        f"{settings.API_V1_STR}/worklogs/list-all-worklogs",
+        headers=superuser_token_headers,
+        params={"remittanceStatus": "REMITTED"},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert [entry["id"] for entry in content["data"]] == [str(remitted.id)]
+
+
+def test_list_worklogs_pagination(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    worklogs = [create_worklog(db) for _ in range(3)]
+    for worklog in worklogs:
+        add_segment(db, worklog, hours=1)
+
+    url = f"{settings.API_V1_STR}/worklogs/list-all-worklogs"
+    first_page = client.get(
+        url, headers=superuser_token_headers, params={"limit": 2, "offset": 0}
+    )
+    assert first_page.status_code == 200
+    content = first_page.json()
+    assert len(content["data"]) == 2
+    assert content["count"] == 3
+
+    second_page = client.get(
+        url, headers=superuser_token_headers, params={"limit": 2, "offset": 2}
+    )
+    assert second_page.status_code == 200
+    content = second_page.json()
+    assert len(content["data"]) == 1
+    assert content["count"] == 3
+
+    seen = {entry["id"] for entry in first_page.json()["data"]} | {
+        entry["id"] for entry in content["data"]
+    }
+    assert seen == {str(worklog.id) for worklog in worklogs}
+
+
+def test_list_worklogs_cursor_pagination(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    worklogs = [create_worklog(db) for _ in range(3)]
+    for worklog in worklogs:
+        add_segment(db, worklog, hours=1)
+
+    url = f"{settings.API_V1_STR}/worklogs/list-all-worklogs"
+    first_page = client.get(
+        url, headers=superuser_token_headers, params={"limit": 2}
+    )
+    assert first_page.status_code == 200
+    content = first_page.json()
+    assert len(content["data"]) == 2
+    assert content["next_cursor"] is not None
+
+    second_page = client.get(
+        url,
+        headers=superuser_token_headers,
+        params={"limit": 2, "cursor": content["next_cursor"]},
+    )
+    assert second_page.status_code == 200
+    second = second_page.json()
+    assert len(second["data"]) == 1
+    assert second["next_cursor"] is None
+
+    seen = {entry["id"] for entry in content["data"]} | {
+        entry["id"] for entry in second["data"]
+    }
+    assert seen == {str(worklog.id) for worklog in worklogs}
+
+    bad_cursor = client.get(
+        url, headers=superuser_token_headers, params={"cursor": "not-a-cursor"}
+    )
+    assert bad_cursor.status_code == 400
+
+
+def test_stream_worklogs_ndjson(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    import json
+
+    worklogs = [create_worklog(db) for _ in range(3)]
+    for worklog in worklogs:
+        add_segment(db, worklog, hours=1)
+
+    response = client.get(
+        f"{settings.API_V1_STR}/worklogs/list-all-worklogs/stream",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert {entry["id"] for entry in lines} == {
+        str(worklog.id) for worklog in worklogs
+    }
+    for entry in lines:
+        assert amount(entry["amounts"]["total_amount"]) == amount("100.00")
+
+
+def test_worklog_summary(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    unremitted = create_worklog(db)
+    add_segment(db, unremitted, hours=2)
+    remitted = create_worklog(db)
+    add_segment(db, remitted, hours=1, settlement_status=SettlementStatus.REMITTED)
+
+    response = client.get(
+        f"{settings.API_V1_STR}/worklogs/summary",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["total"] == 2
+    assert content["remitted_count"] == 1
+    assert content["unremitted_count"] == 1
+    assert amount(content["total_unremitted_amount"]) == amount("200.00")
+
+
+def test_list_worklogs_etag_not_modified(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    worklog = create_worklog(db)
+    add_segment(db, worklog, hours=1)
+
+    url = f"{settings.API_V1_STR}/worklogs/list-all-worklogs"
+    first = client.get(url, headers=superuser_token_headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    unchanged = client.get(
+        url,
+        headers={**superuser_token_headers, "If-None-Match": etag},
+    )
+    assert unchanged.status_code == 304
+
+    # Any data change invalidates the tag and the full response returns
+    add_segment(db, worklog, hours=2)
+    changed = client.get(
+        url,
+        headers={**superuser_token_headers, "If-None-Match": etag},
+    )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_list_worklogs_gzip_compression(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    worklog = create_worklog(db)
+    for hour in range(8):
+        add_segment(db, worklog, hours=1, start_time=SEGMENT_START + timedelta(hours=hour))
+
+    response = client.get(
+        f"{settings.API_V1_STR}/worklogs/list-all-worklogs",
+        headers={**superuser_token_headers, "Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == "gzip"
+    # The client decompresses transparently; the payload is intact
+    assert len(response.json()["data"][0]["time_segments"]) == 8
+
+
+def test_list_worklogs_invalid_filter(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/worklogs/list-all-worklogs",
+        headers=superuser_token_headers,
+        params={"remittanceStatus": "BOGUS"},
+    )
+    assert response.status_code == 422
+
+
+def test_generate_remittances_requires_superuser(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    response = client.post(
+        f"{settings.API_V1_STR}/worklogs/generate-remittances-for-all-users",
+        headers=normal_user_token_headers,
+        json=PERIOD_BODY,
+    )
+    assert response.status_code == 403
+
+
+def test_generate_remittances_rate_limited(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    settings.WORKLOG_SETTLEMENT_RATE_LIMIT_SECONDS = 60
+
+    url = f"{settings.API_V1_STR}/worklogs/generate-remittances-for-all-users"
+    first = client.post(
+        url, headers=superuser_token_headers, params=SYNC_PARAMS, json=PERIOD_BODY
+    )
+    assert first.status_code == 200
+
+    throttled = client.post(
+        url, headers=superuser_token_headers, params=SYNC_PARAMS, json=PERIOD_BODY
+    )
+    assert throttled.status_code == 429
+    assert int(throttled.headers["retry-after"]) > 0
+
+
+def test_generate_remittances_basic(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    worklog_a = create_worklog(db, hourly_rate=Decimal("100.00"))
+    add_segment(db, worklog_a, hours=2)
+    worklog_b = create_worklog(db, hourly_rate=Decimal("50.00"))
+    add_segment(db, worklog_b, hours=1)
+    add_adjustment(
+        db, worklog_b, amount=Decimal("-10.00"), type=AdjustmentType.DEDUCTION
+    )
+
+    response = client.post(
+        f"{settings.API_V1_STR}/worklogs/generate-remittances-for-all-users",
+        headers=superuser_token_headers,
+        params=SYNC_PARAMS,
+        json=PERIOD_BODY,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["remittances_created"] == 2
+    assert amount(content["total_gross_amount"]) == Decimal("250.00")
+    assert amount(content["total_net_amount"]) == Decimal("240.00")
+    assert content["dry_run"] is False
+
+    by_worker = {entry["worker_id"]: entry for entry in content["remittances"]}
+    entry_a = by_worker[str(worklog_a.worker_id)]
+    assert amount(entry_a["gross_amount"]) == Decimal("200.00")
+    assert amount(entry_a["net_amount"]) == Decimal("200.00")
+    entry_b = by_worker[str(worklog_b.worker_id)]
+    assert amount(entry_b["gross_amount"]) == Decimal("50.00")
+    assert amount(entry_b["net_amount"]) == Decimal("40.00")
+
+    # Segments and worklogs are marked settled
+    db.expire_all()
+    segments = db.exec(select(TimeSegment)).all()
+    assert all(
+        segment.settlement_status == SettlementStatus.REMITTED for segment in segments
+    )
+    assert all(segment.remittance_id is not None for segment in segments)
+    worklog_a_db = db.get(WorkLog, worklog_a.id)
+    assert worklog_a_db is not None
+    assert worklog_a_db.total_remitted_amount == Decimal("200.00")
+    worklog_b_db = db.get(WorkLog, worklog_b.id)
+    assert worklog_b_db is not None
+    assert worklog_b_db.total_remitted_amount == Decimal("40.00")
+
+
+def test_generate_remittances_async_job(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    worklog = create_worklog(db, hourly_rate=Decimal("100.00"))
+    add_segment(db, worklog, hours=2)
+
+    response = client.post(
+        f"{settings.API_V1_STR}/worklogs/generate-remittances-for-all-users",
+        headers=superuser_token_headers,
+        json=PERIOD_BODY,
+    )
+    assert response.status_code == 202
+    content = response.json()
+    task_id = content["task_id"]
+    assert content["status_url"].endswith(f"/remittance-jobs/{task_id}")
+
+    # TestClient runs background tasks before returning, so the job has
+    # already finished by the time we poll
+    status = client.get(
+        f"{settings.API_V1_STR}/worklogs/remittance-jobs/{task_id}",
+        headers=superuser_token_headers,
+    )
+    assert status.status_code == 200
+    job = status.json()
+    assert job["status"] == "COMPLETED"
+    assert job["result"]["remittances_created"] == 1
+    assert amount(job["result"]["total_net_amount"]) == Decimal("200.00")
+
+    unknown = client.get(
+        f"{settings.API_V1_STR}/worklogs/remittance-jobs/does-not-exist",
+        headers=superuser_token_headers,
+    )
+    assert unknown.status_code == 404
+
+
+def test_generate_remittances_skips_locked_workers(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    from app.api.routes.worklog.models import WorkerSettlementLock
+    from app.core.db import engine
+
+    worklog = create_worklog(db)
+    add_segment(db, worklog, hours=2)
+    db.add(WorkerSettlementLock(worker_id=worklog.worker_id))
+    db.commit()
+
+    url = f"{settings.API_V1_STR}/worklogs/generate-remittances-for-all-users"
+    with Session(engine) as other:
+        # Simulate a concurrent run holding this worker's lock
+        other.exec(
+            select(WorkerSettlementLock)
+            .where(WorkerSettlementLock.worker_id == worklog.worker_id)
+            .with_for_update()
+        ).all()
+        response = client.post(
+            url,
+            headers=superuser_token_headers,
+            params=SYNC_PARAMS,
+            json=PERIOD_BODY,
+        )
+        assert response.status_code == 200
+        assert response.json()["remittances_created"] == 0
+        other.rollback()
+
+    # With the lock released, the next run settles the worker
+    response = client.post(
+        url,
+        headers=superuser_token_headers,
+        params=SYNC_PARAMS,
+        json=PERIOD_BODY,
+    )
+    assert response.status_code == 200
+    assert response.json()["remittances_created"] == 1
+
+
+def test_generate_remittances_idempotency_key(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    worklog = create_worklog(db)
+    add_segment(db, worklog, hours=2)
+
+    url = f"{settings.API_V1_STR}/worklogs/generate-remittances-for-all-users"
+    headers = {**superuser_token_headers, "Idempotency-Key": "run-1"}
+    first = client.post(
+        url, headers=headers, params=SYNC_PARAMS, json=PERIOD_BODY
+    )
+    assert first.status_code == 200
+    assert first.json()["remittances_created"] == 1
+
+    # The retry replays the stored response without settling again
+    retry = client.post(
+        url, headers=headers, params=SYNC_PARAMS, json=PERIOD_BODY
+    )
+    assert retry.status_code == 200
+    assert retry.json() == first.json()
+    assert len(db.exec(select(Remittance)).all()) == 1
+
+
+def test_generate_remittances_idempotency_key_conflict(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    worklog = create_worklog(db)
+    add_segment(db, worklog, hours=2)
+
+    url = f"{settings.API_V1_STR}/worklogs/generate-remittances-for-all-users"
+    headers = {**superuser_token_headers, "Idempotency-Key": "run-1"}
+    first = client.post(
+        url, headers=headers, params=SYNC_PARAMS, json=PERIOD_BODY
+    )
+    assert first.status_code == 200
+
+    # Reusing the key with a different period must not replay the first
+    # run's response — that would silently leave the new period unsettled
+    conflict = client.post(
+        url,
+        headers=headers,
+        params=SYNC_PARAMS,
+        json={"period_start": "2026-02-01", "period_end": "2026-02-28"},
+    )
+    assert conflict.status_code == 409
+
+
+def test_generate_remittances_dry_run_query_param(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    worklog = create_worklog(db)
+    add_segment(db, worklog, hours=1)
+
+    response = client.post(
+        f"{settings.API_V1_STR}/worklogs/generate-remittances-for-all-users",
+        headers=superuser_token_headers,
+        params={**SYNC_PARAMS, "dryRun": "true"},
+        json=PERIOD_BODY,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["dry_run"] is True
+    assert db.exec(select(Remittance)).all() == []
+
+
+def test_generate_remittances_dry_run(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    worklog = create_worklog(db, hourly_rate=Decimal("100.00"))
+    add_segment(db, worklog, hours=2)
+
+    response = client.post(
+        f"{settings.API_V1_STR}/worklogs/generate-remittances-for-all-users",
+        headers=superuser_token_headers,
+        params=SYNC_PARAMS,
+        json={**PERIOD_BODY, "dry_run": True},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["remittances_created"] == 1
+    assert content["dry_run"] is True
+    assert amount(content["total_net_amount"]) == Decimal("200.00")
+
+    # Nothing is persisted in dry-run mode
+    db.expire_all()
+    assert db.exec(select(Remittance)).all() == []
+    segments = db.exec(select(TimeSegment)).all()
+    assert all(
+        segment.settlement_status == SettlementStatus.UNREMITTED
+        for segment in segments
+    )
+
+
+def test_generate_remittances_delta_settlement(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    worklog = create_worklog(db, hourly_rate=Decimal("100.00"))
+    add_segment(db, worklog, hours=2)
+
+    url = f"{settings.API_V1_STR}/worklogs/generate-remittances-for-all-users"
+    response = client.post(
+        url,
+        headers=superuser_token_headers,
+        params=SYNC_PARAMS,
+        json=PERIOD_BODY,
+    )
+    assert response.status_code == 200
+    assert amount(response.json()["total_net_amount"]) == Decimal("200.00")
+
+    # Retroactive work added after settlement is only paid once
+    add_segment(db, worklog, hours=1)
+    response = client.post(
+        url,
+        headers=superuser_token_headers,
+        params=SYNC_PARAMS,
+        json=PERIOD_BODY,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["remittances_created"] == 1
+    assert amount(content["total_net_amount"]) == Decimal("100.00")
+
+    db.expire_all()
+    worklog_db = db.get(WorkLog, worklog.id)
+    assert worklog_db is not None
+    assert worklog_db.total_remitted_amount == Decimal("300.00")
+
+    # A third run with nothing outstanding creates no remittances
+    response = client.post(
+        url,
+        headers=superuser_token_headers,
+        params=SYNC_PARAMS,
+        json=PERIOD_BODY,
+    )
+    assert response.status_code == 200
+    assert response.json()["remittances_created"] == 0
+
+
+def test_generate_remittances_respects_period(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    from datetime import datetime
+
+    worklog = create_worklog(db, hourly_rate=Decimal("100.00"))
+    add_segment(db, worklog, hours=2)
+    # Work and adjustments outside the requested period stay unsettled
+    add_segment(db, worklog, hours=5, start_time=datetime(2026, 3, 10, 9, 0, 0))
+    add_adjustment(
+        db,
+        worklog,
+        amount=Decimal("25.00"),
+        created_at=datetime(2026, 3, 10, 12, 0, 0),
+    )
+
+    response = client.post(
+        f"{settings.API_V1_STR}/worklogs/generate-remittances-for-all-users",
+        headers=superuser_token_headers,
+        params=SYNC_PARAMS,
+        json=PERIOD_BODY,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["remittances_created"] == 1
+    assert amount(content["total_net_amount"]) == Decimal("200.00")
+
+    db.expire_all()
+    out_of_period = [
+        segment
+        for segment in db.exec(select(TimeSegment)).all()
+        if segment.settlement_status == SettlementStatus.UNREMITTED
+    ]
+    assert len(out_of_period) == 1
+
+
+def test_generate_remittances_invalid_period(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.post(
+        f"{settings.API_V1_STR}/worklogs/generate-remittances-for-all-users",
+        headers=superuser_token_headers,
+        params=SYNC_PARAMS,
+        json={"period_start": "2026-01-31", "period_end": "2026-01-01"},
+    )
+    assert response.status_code == 400
+
+
+def test_list_worklogs_after_settlement(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    worklog = create_worklog(db, hourly_rate=Decimal("100.00"))
+    add_segment(db, worklog, hours=2)
+    response = client.post(
+        f"{settings.API_V1_STR}/worklogs/generate-remittances-for-all-users",
+        headers=superuser_token_headers,
+        params=SYNC_PARAMS,
+        json=PERIOD_BODY,
+    )
+    assert response.status_code == 200
+
+    response = client.get(
+        f"{settings.API_V1_STR}/worklogs/list-all-worklogs",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    entry = response.json()["data"][0]
+    assert entry["remittance_status"] == "REMITTED"
+    assert amount(entry["amounts"]["remitted_amount"]) == Decimal("200.00")
+    assert amount(entry["amounts"]["unremitted_amount"]) == Decimal("0")
+    assert amount(entry["amounts"]["total_amount"]) == Decimal("200.00")
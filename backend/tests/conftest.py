@@ -10,6 +10,7 @@ from app.main import app
 from app.models import Item, User
 from tests.utils.user import authentication_token_from_email
 from tests.utils.utils import get_superuser_token_headers
+from tests.utils.worklog import clear_worklog_data
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -17,6 +18,7 @@ def db() -> Generator[Session, None, None]:
     with Session(engine) as session:
         init_db(session)
         yield session
+        clear_worklog_data(session)
         statement = delete(Item)
         session.execute(statement)
         statement = delete(User)
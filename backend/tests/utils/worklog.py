@@ -0,0 +1,111 @@
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlmodel import Session, delete
+
+from app.api.routes.worklog.models import (
+    Adjustment,
+    AdjustmentType,
+    Remittance,
+    RemittanceIdempotency,
+    SettlementStatus,
+    Task,
+    TimeSegment,
+    TimeSegmentStatus,
+    WorkerSettlementLock,
+    WorkLog,
+)
+from tests.utils.user import create_random_user
+from tests.utils.utils import random_lower_string
+
+# Fixed reference date so tests are independent of the current month
+PERIOD_START = datetime(2026, 1, 1)
+PERIOD_END = datetime(2026, 1, 31)
+SEGMENT_START = datetime(2026, 1, 15, 9, 0, 0)
+
+
+def create_task(db: Session) -> Task:
+    task = Task(title=random_lower_string())
+    db.add(task)
+    db.commit()
+    db.refresh(task)
+    return task
+
+
+def create_worklog(
+    db: Session,
+    *,
+    worker_id: uuid.UUID | None = None,
+    task_id: uuid.UUID | None = None,
+    hourly_rate: Decimal = Decimal("100.00"),
+) -> WorkLog:
+    if worker_id is None:
+        worker_id = create_random_user(db).id
+    if task_id is None:
+        task_id = create_task(db).id
+    worklog = WorkLog(task_id=task_id, worker_id=worker_id, hourly_rate=hourly_rate)
+    db.add(worklog)
+    db.commit()
+    db.refresh(worklog)
+    return worklog
+
+
+def add_segment(
+    db: Session,
+    worklog: WorkLog,
+    *,
+    hours: float = 1.0,
+    start_time: datetime | None = None,
+    status: TimeSegmentStatus = TimeSegmentStatus.ACTIVE,
+    settlement_status: SettlementStatus = SettlementStatus.UNREMITTED,
+) -> TimeSegment:
+    start_time = start_time or SEGMENT_START
+    segment = TimeSegment(
+        worklog_id=worklog.id,
+        start_time=start_time,
+        end_time=start_time + timedelta(hours=hours),
+        status=status,
+        settlement_status=settlement_status,
+    )
+    db.add(segment)
+    db.commit()
+    db.refresh(segment)
+    return segment
+
+
+def add_adjustment(
+    db: Session,
+    worklog: WorkLog,
+    *,
+    amount: Decimal,
+    type: AdjustmentType = AdjustmentType.BONUS,
+    settlement_status: SettlementStatus = SettlementStatus.UNREMITTED,
+    created_at: datetime | None = None,
+) -> Adjustment:
+    adjustment = Adjustment(
+        worklog_id=worklog.id,
+        amount=amount,
+        reason=random_lower_string(),
+        type=type,
+        settlement_status=settlement_status,
+        created_at=created_at or SEGMENT_START,
+    )
+    db.add(adjustment)
+    db.commit()
+    db.refresh(adjustment)
+    return adjustment
+
+
+def clear_worklog_data(db: Session) -> None:
+    for model in (
+        TimeSegment,
+        Adjustment,
+        WorkLog,
+        Remittance,
+        RemittanceIdempotency,
+        WorkerSettlementLock,
+        Task,
+    ):
+        db.execute(delete(model))
+    db.commit()